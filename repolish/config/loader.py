@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
@@ -10,6 +11,18 @@ from repolish.config.validation import (
 )
 
 
+@lru_cache(maxsize=32)
+def _parse_config_text(text: str) -> RepolishConfigFile:
+    """Parse and validate YAML configuration text, caching the result by content.
+
+    A single command may load the same `repolish.yaml` several times (e.g.
+    `repolish link` reads it once to detect the workspace and again per
+    link pass).  Identical text is only parsed and validated once per
+    process; callers must copy the returned model before mutating it.
+    """
+    return RepolishConfigFile.model_validate(yaml.safe_load(text))
+
+
 def load_config_file(yaml_file: Path) -> RepolishConfigFile:
     """Load and validate YAML configuration file without resolution.
 
@@ -19,9 +32,16 @@ def load_config_file(yaml_file: Path) -> RepolishConfigFile:
     Returns:
         A validated RepolishConfigFile instance (not yet resolved).
     """
-    with yaml_file.open(encoding='utf-8') as f:
-        data = yaml.safe_load(f)
-    config_file = RepolishConfigFile.model_validate(data)
+    text = yaml_file.read_text(encoding='utf-8')
+    try:
+        parsed = _parse_config_text(text)
+    except yaml.MarkedYAMLError as exc:
+        # the text was parsed without a stream name; point the marks at the file
+        for mark in (exc.context_mark, exc.problem_mark):
+            if mark is not None:
+                mark.name = str(yaml_file)
+        raise
+    config_file = parsed.model_copy(deep=True)
     config_file.config_file = yaml_file
     return config_file
 
@@ -1,5 +1,8 @@
+import os
 import shutil
+import stat
 from pathlib import Path
+from uuid import uuid4
 
 from hotlog import get_logger
 
@@ -28,10 +31,41 @@ def _remove_target(target: Path) -> None:
         target.unlink()
 
 
+def _swap_symlink(source: Path, target: Path) -> None:
+    """Atomically repoint the existing symlink ``target`` at ``source``.
+
+    The new link is created next to ``target`` under a unique name and
+    renamed over it, so the path never disappears and no separate unlink is
+    needed. Only the staged link created here is ever removed.
+    """
+    staged = target.with_name(f'.{target.name}.{uuid4().hex}.repolish-new')
+    staged.symlink_to(source, target_is_directory=source.is_dir())
+    try:
+        staged.replace(target)
+    except OSError:
+        staged.unlink()
+        raise
+    logger.info(
+        'link_created_successfully',
+        link_type='symlink',
+        target=str(target),
+        _display_level=1,
+    )
+
+
+def _lstat_mode(path: Path) -> int | None:
+    """Return the ``st_mode`` of ``path`` itself (not following links), or None if absent."""
+    try:
+        return path.lstat().st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
 def _resolve_existing_target(
     target_dir: Path,
     source_dir: Path,
     *,
+    is_symlink: bool,
     force: bool,
 ) -> bool | None:
     """Determine what action to take for an existing target directory or symlink.
@@ -39,14 +73,15 @@ def _resolve_existing_target(
     Args:
         target_dir: The existing target path
         source_dir: The source directory to link/copy
+        is_symlink: Whether target_dir is a symlink (possibly dangling)
         force: Whether to force recreation
 
     Returns:
-        True if already a correct symlink (no action needed)
+        True if already a correct symlink or it was atomically repointed
         False if a copy that should be respected (skip operation)
         None if target was removed and caller should proceed with creation
     """
-    if target_dir.is_symlink():
+    if is_symlink:
         result = validate_existing_symlink(
             target_dir,
             source_dir,
@@ -55,13 +90,23 @@ def _resolve_existing_target(
         if not result.needs_update:
             return True  # Already correct symlink
 
+        # Renaming over a directory symlink is not supported on Windows
+        if os.name == 'nt' or not supports_symlinks():  # pragma: no cover - Windows-specific
+            logger.info(
+                'removing_existing_target',
+                target=str(target_dir),
+                _display_level=1,
+            )
+            _remove_target(target_dir)
+            return None  # Proceed with creation
+
         logger.info(
-            'removing_existing_target',
+            'replacing_existing_symlink',
             target=str(target_dir),
             _display_level=1,
         )
-        _remove_target(target_dir)
-        return None  # Proceed with creation
+        _swap_symlink(source_dir, target_dir)
+        return True
 
     # Target is a directory or file (not a symlink)
     result = check_copy_validity(force=force)
@@ -77,6 +122,20 @@ def _resolve_existing_target(
     return None  # Proceed with creation
 
 
+def _symlink_with_parents(source_path: Path, target_path: Path) -> None:
+    """Symlink ``target_path`` to ``source_path``, creating parents only if missing.
+
+    The parent usually exists already, so the link is attempted first and the
+    ``mkdir`` walk only happens when the kernel reports a missing component.
+    """
+    is_dir = source_path.is_dir()
+    try:
+        target_path.symlink_to(source_path, target_is_directory=is_dir)
+    except FileNotFoundError:
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        target_path.symlink_to(source_path, target_is_directory=is_dir)
+
+
 def _create_link_or_copy_generic(source_path: Path, target_path: Path) -> bool:
     """Create a symlink or copy from source to target (files or directories).
 
@@ -87,16 +146,10 @@ def _create_link_or_copy_generic(source_path: Path, target_path: Path) -> bool:
     Returns:
         True if symlink was created, False if copy was used
     """
-    # Create parent directory
-    target_path.parent.mkdir(parents=True, exist_ok=True)
-
     # Create symlink or copy
     if supports_symlinks():
         logger.debug('creating_symlink')
-        target_path.symlink_to(
-            source_path,
-            target_is_directory=source_path.is_dir(),
-        )
+        _symlink_with_parents(source_path, target_path)
         logger.info(
             'link_created_successfully',
             link_type='symlink',
@@ -106,10 +159,14 @@ def _create_link_or_copy_generic(source_path: Path, target_path: Path) -> bool:
         return True
 
     logger.debug('symlinks_not_supported_copying')
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    # shutil.copy already copies file data in-kernel where the platform
+    # allows it; unlike copy2 it skips copying timestamps and xattrs, which
+    # nothing reads since copies are recreated on every link.
     if source_path.is_dir():
-        shutil.copytree(source_path, target_path)
+        shutil.copytree(source_path, target_path, copy_function=shutil.copy)
     else:
-        shutil.copy2(source_path, target_path)
+        shutil.copy(source_path, target_path)
     logger.info(
         'copy_created_successfully',
         link_type='copy',
@@ -153,9 +210,15 @@ def link_resources(
 
     validate_source_directory(source_dir)
 
-    # Handle existing target if present
-    if target_dir.exists() or target_dir.is_symlink():
-        result = _resolve_existing_target(target_dir, source_dir, force=force)
+    # Handle existing target if present; one lstat also sees dangling links
+    target_mode = _lstat_mode(target_dir)
+    if target_mode is not None:
+        result = _resolve_existing_target(
+            target_dir,
+            source_dir,
+            is_symlink=stat.S_ISLNK(target_mode),
+            force=force,
+        )
         if result is not None:
             return result
 
@@ -214,8 +277,5 @@ def create_additional_link(
             msg = f'Target already exists: {target_path}'
             raise FileExistsError(msg)
 
-    # Create parent directory for target
-    target_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Create symlink or copy
+    # Create symlink or copy (this also creates the target's parent directory)
     return _create_link_or_copy_generic(source_path, target_path)
@@ -38,15 +38,18 @@ def validate_source_directory(source_dir: Path) -> None:
         FileNotFoundError: If source_dir does not exist
         SymlinkError: If source_dir is not a directory
     """
+    # One stat answers the common case; only a failure needs a second look.
+    if source_dir.is_dir():
+        return
+
     if not source_dir.exists():
         logger.error('source_does_not_exist', source=str(source_dir))
         msg = f'Source directory does not exist: {source_dir}'
         raise FileNotFoundError(msg)
 
-    if not source_dir.is_dir():
-        logger.error('source_is_not_directory', source=str(source_dir))
-        msg = f'Source must be a directory: {source_dir}'
-        raise SymlinkError(msg)
+    logger.error('source_is_not_directory', source=str(source_dir))
+    msg = f'Source must be a directory: {source_dir}'
+    raise SymlinkError(msg)
 
 
 def validate_existing_symlink(
@@ -68,8 +71,14 @@ def validate_existing_symlink(
         - is_correct: True if it's already pointing to the correct source
     """
     try:
-        current_target = normalize_windows_path(target_dir.readlink().resolve())
-        expected_target = normalize_windows_path(source_dir.resolve())
+        link_target = target_dir.readlink()
+        if link_target.is_absolute() and link_target == source_dir:
+            # The linker writes resolved absolute sources, so an exact match
+            # is already correct and needs no resolve() of either side.
+            current_target = expected_target = source_dir
+        else:
+            current_target = normalize_windows_path(link_target.resolve())
+            expected_target = normalize_windows_path(source_dir.resolve())
         if current_target == expected_target and current_target.exists():
             if force:
                 logger.info(
@@ -1,5 +1,6 @@
 import os
 import tempfile
+from functools import cache
 from pathlib import Path
 
 
@@ -41,8 +42,13 @@ def _can_create_symlink_in_tmpdir() -> bool:  # pragma: no cover - Windows-speci
         return result
 
 
+@cache
 def supports_symlinks() -> bool:
-    """Check if the current system supports symlinks (and has permission)."""
+    """Check if the current system supports symlinks (and has permission).
+
+    The answer cannot change during a run, so it is computed once; on Windows
+    that saves a probe symlink in a temp dir for every link created.
+    """
     if not hasattr(os, 'symlink'):
         return False
     if os.name != 'nt':
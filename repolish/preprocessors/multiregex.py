@@ -5,11 +5,28 @@ extracting multiple key-value pairs from a block and replacing them in sections.
 """
 
 import re
+from collections.abc import Iterable
+from functools import lru_cache
 
 from hotlog import get_logger
 
 logger = get_logger(__name__)
 
+_SECTION_START_RE = re.compile(r'^\[(\w+)\]')
+_KEY_VALUE_RE = re.compile(r'^\s*(")?([^"=\s]+)(")?\s*=\s*"([^"]*)"')
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, flags: int) -> re.Pattern[str]:
+    """Compile a template-supplied pattern, reusing earlier compiles of it.
+
+    Block and value patterns come from template markers, so the same few
+    strings recur for every file a provider renders. A dedicated cache keeps
+    them compiled even when other code cycles through `re`'s small internal
+    cache.
+    """
+    return re.compile(pattern, flags)
+
 
 def apply_multiregex_replacements(
     content: str,
@@ -23,7 +40,9 @@ def apply_multiregex_replacements(
         multiregexes=[str(name) for name in multiregexes],
     )
 
-    # Process each multiregex pair
+    # Extract the local values for every tag whose block is present, then
+    # rewrite the template in one pass over its lines
+    values_by_tag: dict[str, dict[str, str]] = {}
     for tag, multi_regex in multiregexes.items():
         if tag not in multiregex_blocks:
             logger.debug('multiregex_missing_block', tag=tag)
@@ -37,11 +56,12 @@ def apply_multiregex_replacements(
         if block_content is None:
             continue
 
-        values = _extract_values_from_block(multi_regex, block_content, tag)
-        content = _remove_multiregex_comments(content, tag)
-        content = _replace_values_in_section(content, tag, values)
+        values_by_tag[tag] = _extract_values_from_block(multi_regex, block_content, tag)
 
-    return content
+    if not values_by_tag:
+        return content
+    content = _remove_multiregex_comments(content, values_by_tag)
+    return _replace_values_in_sections(content, values_by_tag)
 
 
 def _extract_block_content(
@@ -50,7 +70,7 @@ def _extract_block_content(
     tag: str,
 ) -> str | None:
     """Extract block content from local file using regex."""
-    block_re = re.compile(block_regex, re.DOTALL | re.MULTILINE)
+    block_re = _compile_pattern(block_regex, re.DOTALL | re.MULTILINE)
     block_match = block_re.search(local_file_content)
     if not block_match:
         logger.debug(
@@ -75,7 +95,7 @@ def _extract_values_from_block(
     tag: str,
 ) -> dict[str, str]:
     """Extract key-value pairs from block content."""
-    multi_re = re.compile(multi_regex, re.MULTILINE)
+    multi_re = _compile_pattern(multi_regex, re.MULTILINE)
     matches = multi_re.findall(block_content)
 
     # Build dict of key to value (handle different capture group structures)
@@ -98,39 +118,38 @@ def _extract_values_from_block(
     return values
 
 
-def _remove_multiregex_comments(content: str, tag: str) -> str:
-    """Remove multiregex comments from template."""
-    content = re.sub(
-        rf'## repolish-multiregex-block\[{re.escape(tag)}\]:.*\n',
-        '',
-        content,
-        flags=re.MULTILINE,
-    )
+def _remove_multiregex_comments(content: str, tags: Iterable[str]) -> str:
+    """Remove the multiregex marker comments of ``tags`` from the template."""
+    names = '|'.join(re.escape(tag) for tag in tags)
     return re.sub(
-        rf'## repolish-multiregex\[{re.escape(tag)}\]:.*\n',
+        rf'## repolish-multiregex(?:-block)?\[(?:{names})\]:.*\n',
         '',
         content,
         flags=re.MULTILINE,
     )
 
 
-def _replace_values_in_section(
+def _replace_values_in_sections(
     content: str,
-    tag: str,
-    values: dict[str, str],
+    values_by_tag: dict[str, dict[str, str]],
 ) -> str:
-    """Replace template defaults with extracted values in the specified section."""
+    """Replace template defaults with extracted values in each tag's section.
+
+    A section runs from its ``[tag]`` header to the next section header, so
+    tracking the most recent header name is enough to route every key=value
+    line to the values of its own tag.
+    """
     lines = content.split('\n')
     result_lines = []
-    in_section = False
+    values: dict[str, str] | None = None
 
     for line in lines:
         processed_line = line
-        if _is_section_start(line, tag):
-            in_section = True
-        elif in_section and _is_section_exit(line, tag):
-            in_section = False
-        elif in_section and _is_key_value_line(line):
+        section_match = _SECTION_START_RE.match(line.strip())
+        if section_match is not None:
+            values = values_by_tag.get(section_match.group(1))
+        elif values is not None:
+            # lines that are not key=value assignments come back unchanged
             processed_line = _replace_key_value(line, values)
 
         result_lines.append(processed_line)
@@ -138,28 +157,14 @@ def _replace_values_in_section(
     return '\n'.join(result_lines)
 
 
-def _is_section_start(line: str, tag: str) -> bool:
-    """Check if the line starts a new section with the given tag."""
-    section_start_pattern = re.compile(r'^\[(\w+)\]')
-    section_match = section_start_pattern.match(line.strip())
-    return section_match is not None and section_match.group(1) == tag
-
-
-def _is_section_exit(line: str, tag: str) -> bool:
-    """Check if the line starts a new section, indicating exit from current tag section."""
-    section_start_pattern = re.compile(r'^\[(\w+)\]')
-    section_match = section_start_pattern.match(line.strip())
-    return section_match is not None and section_match.group(1) != tag
-
-
 def _is_key_value_line(line: str) -> bool:
     """Check if the line is a key=value assignment."""
-    return bool(re.match(r'^\s*(")?([^"=\s]+)(")?\s*=\s*"([^"]*)"', line))
+    return _KEY_VALUE_RE.match(line) is not None
 
 
 def _replace_key_value(line: str, values: dict[str, str]) -> str:
     """Replace the value in a key=value line if the key exists in values dict."""
-    match = re.match(r'^\s*(")?([^"=\s]+)(")?\s*=\s*"([^"]*)"', line)
+    match = _KEY_VALUE_RE.match(line)
     if match:
         quote1, key, quote2, default_value = match.groups()
         actual_value = values.get(key, default_value or '')
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from hotlog import configure_logging, resolve_verbosity
+
 from repolish.cli.main import app
 from repolish.cli.testing import CliRunner
 
@@ -86,9 +88,13 @@ def test_scaffold_idempotent(tmp_path: Path) -> None:
         app,
         ['scaffold', str(tmp_path), '--package', 'my_provider'],
     )
-    result = runner.invoke(
-        app,
-        ['-v', 'scaffold', str(tmp_path), '--package', 'my_provider'],
-    )
+    try:
+        result = runner.invoke(
+            app,
+            ['-v', 'scaffold', str(tmp_path), '--package', 'my_provider'],
+        )
+    finally:
+        # `-v` raises the global log verbosity; reset it for later tests.
+        configure_logging(verbosity=resolve_verbosity(verbose=0))
     assert result.exit_code == 0
     assert 'nothing to write' in result.output
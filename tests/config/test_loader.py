@@ -3,9 +3,11 @@ from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
+import pytest_mock
 import yaml
 
-from repolish.config import load_config
+from repolish.config import load_config, load_config_file
+from repolish.config.loader import _parse_config_text
 from repolish.exceptions import (
     ConfigValidationError,
     DirectoryValidationError,
@@ -467,3 +469,43 @@ def test_load_config_providers_order_optional(
 
     # Should process providers in the order they appear in the YAML (dict key order)
     assert list(config.providers.keys()) == ['base', 'python', 'extras']
+
+
+def test_load_config_file_caches_parse_by_content(
+    tmp_path: Path,
+    mocker: pytest_mock.MockerFixture,
+):
+    """Identical config text is parsed once and each caller gets its own copy."""
+    config_text = 'providers:\n  cached_lib:\n    cli: cached-lib-link\n'
+    first_file = tmp_path / 'a' / 'repolish.yaml'
+    second_file = tmp_path / 'b' / 'repolish.yaml'
+    for config_path in (first_file, second_file):
+        config_path.parent.mkdir()
+        config_path.write_text(config_text)
+
+    _parse_config_text.cache_clear()
+    spy = mocker.spy(yaml, 'safe_load')
+
+    first = load_config_file(first_file)
+    second = load_config_file(second_file)
+
+    assert spy.call_count == 1
+    assert first is not second
+    assert first.providers == second.providers
+    assert first.config_file == first_file
+    assert second.config_file == second_file
+
+    first.providers['cached_lib'].cli = 'changed'
+    assert load_config_file(second_file).providers['cached_lib'].cli == 'cached-lib-link'
+
+
+def test_load_config_file_yaml_error_names_the_file(tmp_path: Path):
+    """Syntax errors still point at the config file despite the text cache."""
+    config_path = tmp_path / 'repolish.yaml'
+    config_path.write_text('providers: [broken\nother: 1\n')
+
+    with pytest.raises(yaml.YAMLError) as exc_info:
+        load_config_file(config_path)
+
+    assert f'in "{config_path}", line' in str(exc_info.value)
+    assert '<unicode string>' not in str(exc_info.value)
@@ -1,21 +1,97 @@
+import os
+import shutil
+import tempfile
 from pathlib import Path
 from textwrap import dedent
 
 import pytest
 
+from tests.support.fs import write_files
+
+_TMPFS_ROOT = Path('/dev/shm')  # noqa: S108 - per-run mkdtemp subdirectory, opt-in via REPOLISH_TMPFS
+_TMPFS_RUN_DIR = pytest.StashKey[Path]()
+
+
+# Fixtures that put a test on the real filesystem; such tests get the `fs` mark.
+_FS_FIXTURES = frozenset(('tmp_path', 'tmp_path_factory', 'tmpdir', 'tmpdir_factory'))
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        '--no-fs',
+        action='store_true',
+        default=False,
+        help='deselect tests marked `fs` (those that touch the filesystem)',
+    )
+
+
+def _use_tmpfs_basetemp(config: pytest.Config) -> None:
+    """Move pytest's basetemp onto tmpfs when `REPOLISH_TMPFS=1` is set.
+
+    Most tests build small trees under `tmp_path`; keeping them in RAM avoids
+    the mkdir/write/symlink latency of a disk-backed temp dir. Each run gets
+    its own directory, since pytest wipes basetemp at startup and concurrent
+    runs must not delete each other's trees. An explicit `--basetemp` always
+    wins, and platforms without a writable `/dev/shm` keep the default
+    location.
+    """
+    if os.environ.get('REPOLISH_TMPFS') != '1' or config.option.basetemp:
+        return
+    if not _TMPFS_ROOT.is_dir() or not os.access(_TMPFS_ROOT, os.W_OK):
+        return
+    run_dir = Path(tempfile.mkdtemp(prefix=f'repolish-tests-{os.getuid()}-', dir=_TMPFS_ROOT))
+    config.stash[_TMPFS_RUN_DIR] = run_dir
+    config.option.basetemp = str(run_dir)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line('markers', 'fs: test touches the filesystem')
+    _use_tmpfs_basetemp(config)
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """Free the tmpfs run directory after a green run; keep it for failures."""
+    run_dir = session.config.stash.get(_TMPFS_RUN_DIR, None)
+    if run_dir is not None and exitstatus == pytest.ExitCode.OK:
+        shutil.rmtree(run_dir, ignore_errors=True)
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config,
+    items: list[pytest.Item],
+) -> None:
+    """Mark tests that request a temp-dir fixture as `fs`; honour `--no-fs`.
+
+    With `--no-fs` the marked tests are deselected, leaving the pure-logic
+    tests for a quick inner loop (or a separate CI shard).
+    """
+    kept: list[pytest.Item] = []
+    deselected: list[pytest.Item] = []
+    for item in items:
+        if _FS_FIXTURES.intersection(getattr(item, 'fixturenames', ())):
+            item.add_marker(pytest.mark.fs)
+        if config.getoption('--no-fs') and item.get_closest_marker('fs'):
+            deselected.append(item)
+        else:
+            kept.append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = kept
+
 
 @pytest.fixture
 def make_provider(tmp_path: Path):
     """Return a helper that writes a provider module and returns its path.
 
     The returned callable has signature `(src: str, name: str='prov')->str`.
+    Providers are written under the test's own `tmp_path`, so tests may
+    modify the directory or the loaded module without affecting others.
     """
 
     def _inner(src: str, name: str = 'prov') -> str:
-        d = tmp_path / name
-        d.mkdir(parents=True, exist_ok=True)
-        (d / 'repolish.py').write_text(dedent(src))
-        return str(d)
+        write_files(tmp_path, {f'{name}/repolish.py': dedent(src)})
+        return str(tmp_path / name)
 
     return _inner
 
@@ -1,64 +1,55 @@
 """Tests for hydration application functionality."""
 
+from dataclasses import dataclass
 from pathlib import Path
 
+import pytest
+
 from repolish.hydration.application import (
     apply_generated_output,
 )
 from repolish.providers import SessionBundle, TemplateMapping
 
 
-def test_apply_creates_file_when_missing(tmp_path: Path):
-    """Test that create_only files are created when they don't exist."""
-    setup_output = tmp_path / 'setup-output'
-    repolish_dir = setup_output / 'repolish'
-    repolish_dir.mkdir(parents=True)
-
-    # Template provides regular rendered file (already processed by Jinja)
-    (repolish_dir / 'src' / 'pkg').mkdir(parents=True)
-    (repolish_dir / 'src' / 'pkg' / '__init__.py').write_text(
-        '# Initial content',
-    )
-
-    base_dir = tmp_path / 'project'
-    base_dir.mkdir()
-
-    # File doesn't exist yet
-    providers = SessionBundle(
-        anchors={},
-        delete_files=[],
-        file_mappings={},
-        delete_history={},
-        create_only_files=[Path('src/pkg/__init__.py')],
-    )
-
-    apply_generated_output(setup_output, providers, base_dir)
-
-    # File should be created
-    init_file = base_dir / 'src' / 'pkg' / '__init__.py'
-    assert init_file.exists()
-    assert init_file.read_text() == '# Initial content'
-
-
-def test_apply_skips_file_when_exists(tmp_path: Path):
-    """Test that create_only files are NOT overwritten if they already exist."""
+@dataclass
+class CreateOnlyCase:
+    name: str
+    # Content already in the project before applying, or None if absent.
+    existing: str | None
+    expected: str
+
+
+@pytest.mark.parametrize(
+    'case',
+    [
+        CreateOnlyCase(
+            name='creates_when_missing',
+            existing=None,
+            expected='# Template content',
+        ),
+        CreateOnlyCase(
+            name='skips_when_exists',
+            existing='# Existing content',
+            expected='# Existing content',
+        ),
+    ],
+    ids=lambda case: case.name,
+)
+def test_apply_create_only_file(tmp_path: Path, case: CreateOnlyCase):
+    """create_only files are created when missing and never overwritten."""
     setup_output = tmp_path / 'setup-output'
     repolish_dir = setup_output / 'repolish'
-    repolish_dir.mkdir(parents=True)
-
-    # Template provides rendered file with new content
     (repolish_dir / 'src' / 'pkg').mkdir(parents=True)
     (repolish_dir / 'src' / 'pkg' / '__init__.py').write_text(
         '# Template content',
     )
 
     base_dir = tmp_path / 'project'
+    init_file = base_dir / 'src' / 'pkg' / '__init__.py'
     base_dir.mkdir()
-
-    # File already exists with different content
-    existing_file = base_dir / 'src' / 'pkg' / '__init__.py'
-    existing_file.parent.mkdir(parents=True)
-    existing_file.write_text('# Existing content')
+    if case.existing is not None:
+        init_file.parent.mkdir(parents=True)
+        init_file.write_text(case.existing)
 
     providers = SessionBundle(
         anchors={},
@@ -70,9 +61,7 @@ def test_apply_skips_file_when_exists(tmp_path: Path):
 
     apply_generated_output(setup_output, providers, base_dir)
 
-    # File should NOT be overwritten
-    assert existing_file.exists()
-    assert existing_file.read_text() == '# Existing content'
+    assert init_file.read_text() == case.expected
 
 
 def test_apply_file_mapping_copy(tmp_path: Path):
@@ -32,10 +32,24 @@ if TYPE_CHECKING:
 
     from repolish.cli.testing import Result
 
+_INTEGRATION_DIR = Path(__file__).parent
 _EXAMPLES_DIR = Path(__file__).parent.parent.parent / 'provider-examples'
 _DIST_DIR = _EXAMPLES_DIR / '.dist'
 
-_FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+_FIXTURES_DIR = _INTEGRATION_DIR / 'fixtures'
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Pin integration tests to a single xdist worker.
+
+    The session-scoped ``installed_providers`` fixture installs and uninstalls
+    wheels in the running venv, so two workers must never run it at once.
+    Under ``pytest -n auto --dist=loadgroup`` every test in this directory
+    shares the ``integration`` group; outside xdist the mark is inert.
+    """
+    for item in items:
+        if item.path.is_relative_to(_INTEGRATION_DIR):
+            item.add_marker(pytest.mark.xdist_group('integration'))
 
 
 def init_git_repo(
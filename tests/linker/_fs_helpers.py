@@ -0,0 +1,71 @@
+"""Assertion and setup helpers for the symlink/copy tests.
+
+Each assertion takes a single `os.lstat` of the target and reads the mode
+bits from it, instead of probing `exists()`, `is_dir()` and `is_symlink()`
+one syscall at a time.
+"""
+
+import os
+import stat
+from pathlib import Path
+
+from tests.support.fs import write_files
+
+
+def _lstat(path: Path) -> os.stat_result | None:
+    """Return `os.lstat(path)`, or None when nothing exists at `path`."""
+    try:
+        return os.lstat(path)
+    except FileNotFoundError:
+        return None
+
+
+def assert_symlink_with_file(target: Path, filename: str, content: str) -> None:
+    """Assert that target is a symlink, exists, and contains the expected file with content."""
+    st = _lstat(target)
+    assert st is not None, f'Expected {target} to exist'
+    assert stat.S_ISLNK(st.st_mode), f'Expected {target} to be a symlink'
+    # Reading through the link also proves it is not dangling.
+    assert (target / filename).read_bytes() == content.encode()
+
+
+def assert_copied_directory(target: Path) -> None:
+    """Assert that target is a copied directory (not symlink)."""
+    st = _lstat(target)
+    assert st is not None, f'Expected {target} to exist'
+    assert not stat.S_ISLNK(st.st_mode), f'Expected {target} to not be a symlink'
+    assert stat.S_ISDIR(st.st_mode), f'Expected {target} to be a directory'
+
+
+def assert_copy_with_file(target: Path, filename: str, content: str) -> None:
+    """Assert that target is a copy (not symlink), exists, and contains the expected file with content."""
+    assert_copied_directory(target)
+    assert (target / filename).read_bytes() == content.encode()
+
+
+def assert_copied_file(target: Path, content: str) -> None:
+    """Assert that target is a regular file (not symlink) with the expected content."""
+    st = _lstat(target)
+    assert st is not None, f'Expected {target} to exist'
+    assert stat.S_ISREG(st.st_mode), f'Expected {target} to be a regular file'
+    assert target.read_bytes() == content.encode()
+
+
+def assert_dangling_symlink(target: Path) -> None:
+    """Assert that target is a symlink whose destination no longer exists."""
+    st = _lstat(target)
+    assert st is not None, f'Expected {target} to exist'
+    assert stat.S_ISLNK(st.st_mode), f'Expected {target} to be a symlink'
+    assert not target.exists(), f'Expected {target} to be dangling'
+
+
+def create_test_dir(
+    tmp_path: Path,
+    name: str,
+    filename: str = 'content.txt',
+    content: str = 'content',
+) -> Path:
+    """Create a test directory with a file inside."""
+    test_dir = tmp_path / name
+    write_files(test_dir, {filename: content})
+    return test_dir
@@ -1,5 +1,14 @@
-"""Shared fixtures for linker tests."""
+"""Shared fixtures for linker tests.
 
+Every fixture writes under `tmp_path` or `tmp_path_factory`, both of which
+are private to an xdist worker, and module-level test data is never
+mutated.  The linker tests therefore need no `xdist_group` and can be
+spread freely with `pytest tests/linker -n auto`.
+"""
+
+import shutil
+import subprocess
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, TypedDict
 
@@ -7,7 +16,9 @@ import cyclopts
 import pytest
 import pytest_mock
 
+from repolish.config.models import ProviderFileInfo
 from repolish.linker.decorator import resource_linker
+from tests.support.fs import write_files
 
 
 class PackageDictFixture(TypedDict):
@@ -73,18 +84,103 @@ def basic_link_cli(mocked_package: dict[str, Any]) -> cyclopts.App:
     return link_cli
 
 
-@pytest.fixture
-def source_with_file(tmp_path: Path) -> Path:
-    """Create a source directory with a test file."""
-    source = tmp_path / 'source'
-    source.mkdir()
-    (source / 'file.txt').write_text('content')
+@pytest.fixture(scope='session')
+def prebuilt_source(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the `source/file.txt` tree once per session."""
+    source = tmp_path_factory.mktemp('prebuilt') / 'source'
+    write_files(source, {'file.txt': 'content'})
     return source
 
 
+@pytest.fixture
+def source_with_file(tmp_path: Path, prebuilt_source: Path) -> Path:
+    """Copy the session source directory (with its test file) into `tmp_path`.
+
+    Files are real copies, so tests may modify them freely.
+    """
+    return Path(shutil.copytree(prebuilt_source, tmp_path / 'source'))
+
+
 @pytest.fixture
 def provider_resources_setup(tmp_path: Path) -> Path:
     """Set up provider resources directory structure."""
     provider_resources = tmp_path / '.repolish' / 'mylib'
     provider_resources.mkdir(parents=True)
     return provider_resources
+
+
+# Contents of `.repolish/mylib/` in the canonical provider tree.
+CANONICAL_PROVIDER_FILES: dict[str, str] = {
+    'config.txt': 'content',
+    'configs/.editorconfig': 'root = true',
+    'configs/.prettierrc': '{}',
+    'docs/README.md': '# Docs',
+}
+
+
+@pytest.fixture(scope='session')
+def canonical_provider_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build a project root holding `.repolish/mylib/` once per session."""
+    root = tmp_path_factory.mktemp('canonical-provider')
+    write_files(root / '.repolish' / 'mylib', CANONICAL_PROVIDER_FILES)
+    return root
+
+
+@pytest.fixture
+def provider_tmp(tmp_path: Path, canonical_provider_tree: Path) -> Path:
+    """Copy the canonical provider tree into `tmp_path`.
+
+    Returns the provider's resources directory (`tmp_path/.repolish/mylib`).
+    Files are real copies, so tests may link to them and modify them freely.
+    """
+    shutil.copytree(canonical_provider_tree, tmp_path, dirs_exist_ok=True)
+    return tmp_path / '.repolish' / 'mylib'
+
+
+def provider_file_info(resources_dir: str, site_package_dir: str) -> ProviderFileInfo:
+    """Build a `ProviderFileInfo` from known-good strings without validation.
+
+    Intended for mock return values; tests that exercise field validation
+    should call the `ProviderFileInfo` constructor directly.
+    """
+    return ProviderFileInfo.model_construct(
+        resources_dir=resources_dir,
+        site_package_dir=site_package_dir,
+    )
+
+
+@dataclass
+class FakeSubprocessRun:
+    """Lightweight stand-in for `subprocess.run`.
+
+    Each call is recorded in `calls` as `(args, kwargs)` and answered with the
+    next entry from `results`; an exception entry is raised instead of
+    returned.  When `results` runs out an empty successful
+    `CompletedProcess` is returned.
+    """
+
+    results: list[subprocess.CompletedProcess[str] | BaseException] = field(
+        default_factory=list,
+    )
+    calls: list[tuple[list[str], dict[str, Any]]] = field(default_factory=list)
+
+    def __call__(
+        self,
+        args: list[str],
+        **kwargs: Any,
+    ) -> subprocess.CompletedProcess[str]:
+        self.calls.append((args, kwargs))
+        if not self.results:
+            return subprocess.CompletedProcess(args, 0, stdout='')
+        result = self.results.pop(0)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+
+@pytest.fixture
+def fake_subprocess_run(mocker: pytest_mock.MockerFixture) -> FakeSubprocessRun:
+    """Replace `subprocess.run` with a recording `FakeSubprocessRun`."""
+    fake = FakeSubprocessRun()
+    mocker.patch('subprocess.run', new=fake)
+    return fake
@@ -1,6 +1,9 @@
 import json
+from contextlib import AbstractContextManager
 from dataclasses import dataclass
 from pathlib import Path
+from unittest import mock
+from unittest.mock import MagicMock
 
 import pytest
 import pytest_mock
@@ -15,6 +18,18 @@ from tests.linker.conftest import (
 
 runner = CliRunner()
 
+# Link targets relative to the test's working directory.
+_DEFAULT_TARGET = Path('.repolish') / 'mylib'
+_LIBS_TARGET = Path('.libs') / 'mylib'
+
+
+def _patch_package_root(pkg_root: Path) -> AbstractContextManager[MagicMock]:
+    """Patch `_get_package_root` so the decorator resolves *pkg_root*."""
+    return mock.patch(
+        'repolish.linker.decorator._get_package_root',
+        return_value=pkg_root,
+    )
+
 
 def _assert_linked(target: Path, expected_source: Path) -> None:
     """Assert that *target* is a symlink (or copy) resolving to *expected_source*."""
@@ -34,36 +49,28 @@ def test_resource_linker_basic_usage(
     result = runner.invoke(basic_link_cli, [])
 
     assert result.exit_code == 0
-    _assert_linked(
-        tmp_path / '.repolish' / 'mylib',
-        mocked_package['resources'],
-    )
+    _assert_linked(tmp_path / _DEFAULT_TARGET, mocked_package['resources'])
 
 
 def test_resource_linker_info_mode(
     test_package: PackageDictFixture,
-    mocker: pytest_mock.MockerFixture,
 ):
     """Test resource_linker --info outputs JSON."""
+    with _patch_package_root(test_package['pkg_root']):
 
-    @resource_linker(
-        _pkg_name='mylib',
-        _proj_name='mylib',
-        resources_dir='resources',
-    )
-    def link_cli() -> None:
-        pass
-
-    mocker.patch(
-        'repolish.linker.decorator._get_package_root',
-        return_value=test_package['pkg_root'],
-    )
+        @resource_linker(
+            _pkg_name='mylib',
+            _proj_name='mylib',
+            resources_dir='resources',
+        )
+        def link_cli() -> None:
+            pass
 
     result = runner.invoke(link_cli, ['--info'])
 
     assert result.exit_code == 0
     info = json.loads(result.output)
-    assert 'site_package_dir' in info
+    assert info['site_package_dir'] == str(test_package['resources'])
     assert 'resources_dir' in info
 
 
@@ -99,35 +106,28 @@ def test_resource_linker_force_flag(
     result = runner.invoke(basic_link_cli, ['--force'])
 
     assert result.exit_code == 0
-    _assert_linked(
-        tmp_path / '.repolish' / 'mylib',
-        mocked_package['resources'],
-    )
+    _assert_linked(tmp_path / _DEFAULT_TARGET, mocked_package['resources'])
 
 
 def test_resource_linker_info_mode_ignores_templates_subdir(
     test_package: PackageDictFixture,
-    mocker: pytest_mock.MockerFixture,
 ):
     """`--info` output should not contain outdated templates subdir key."""
+    with _patch_package_root(test_package['pkg_root']):
 
-    @resource_linker(
-        _pkg_name='mylib',
-        _proj_name='mylib',
-        resources_dir='resources',
-    )
-    def link_cli() -> None:
-        pass
-
-    mocker.patch(
-        'repolish.linker.decorator._get_package_root',
-        return_value=test_package['pkg_root'],
-    )
+        @resource_linker(
+            _pkg_name='mylib',
+            _proj_name='mylib',
+            resources_dir='resources',
+        )
+        def link_cli() -> None:
+            pass
 
     result = runner.invoke(link_cli, ['--info'])
 
     assert result.exit_code == 0
     info = json.loads(result.output)
+    assert info['site_package_dir'] == str(test_package['resources'])
     assert 'templates_subdir' not in info
 
 
@@ -158,7 +158,6 @@ def test_resource_linker_calls_wrapped_function(
 def test_resource_linker_handles_link_error(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
-    mocker: pytest_mock.MockerFixture,
 ):
     """Test resource_linker exits with code 1 when linking fails."""
     pkg_root = tmp_path / 'mylib'
@@ -167,28 +166,25 @@ def test_resource_linker_handles_link_error(
 
     monkeypatch.chdir(tmp_path)
 
-    @resource_linker(
-        _pkg_name='mylib',
-        _proj_name='mylib',
-        resources_dir='resources',
-    )
-    def link_cli() -> None:
-        pass
+    with _patch_package_root(pkg_root):
 
-    mocker.patch(
-        'repolish.linker.decorator._get_package_root',
-        return_value=pkg_root,
-    )
+        @resource_linker(
+            _pkg_name='mylib',
+            _proj_name='mylib',
+            resources_dir='resources',
+        )
+        def link_cli() -> None:
+            pass
 
     result = runner.invoke(link_cli, [])
 
     assert result.exit_code == 1
+    assert str(pkg_root / 'resources') in result.output
 
 
 def test_resource_linker_custom_target_base(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
-    mocker: pytest_mock.MockerFixture,
 ):
     """Test resource_linker with custom default_target_base."""
     pkg_root = tmp_path / 'mylib'
@@ -198,50 +194,44 @@ def test_resource_linker_custom_target_base(
 
     monkeypatch.chdir(tmp_path)
 
-    mocker.patch(
-        'repolish.linker.decorator._get_package_root',
-        return_value=pkg_root,
-    )
+    with _patch_package_root(pkg_root):
 
-    @resource_linker(
-        _pkg_name='mylib',
-        _proj_name='mylib',
-        resources_dir='resources',
-        default_target_base='.libs',
-    )
-    def link_cli() -> None:
-        pass
+        @resource_linker(
+            _pkg_name='mylib',
+            _proj_name='mylib',
+            resources_dir='resources',
+            default_target_base='.libs',
+        )
+        def link_cli() -> None:
+            pass
 
     result = runner.invoke(link_cli, [])
 
     assert result.exit_code == 0
-    _assert_linked(tmp_path / '.libs' / 'mylib', resources)
+    _assert_linked(tmp_path / _LIBS_TARGET, resources)
 
 
 def test_resource_linker_does_not_call_wrapped_in_info_mode(
     test_package: PackageDictFixture,
-    mocker: pytest_mock.MockerFixture,
 ):
     """Test resource_linker doesn't call wrapped function in --info mode."""
     called: list[bool] = []
 
-    @resource_linker(
-        _pkg_name='mylib',
-        _proj_name='mylib',
-        resources_dir='resources',
-    )
-    def link_cli() -> None:
-        called.append(True)
+    with _patch_package_root(test_package['pkg_root']):
 
-    mocker.patch(
-        'repolish.linker.decorator._get_package_root',
-        return_value=test_package['pkg_root'],
-    )
+        @resource_linker(
+            _pkg_name='mylib',
+            _proj_name='mylib',
+            resources_dir='resources',
+        )
+        def link_cli() -> None:
+            called.append(True)
 
     result = runner.invoke(link_cli, ['--info'])
 
     assert result.exit_code == 0
     assert called == []
+    assert json.loads(result.output)['site_package_dir'] == str(test_package['resources'])
 
 
 @dataclass
@@ -445,4 +435,4 @@ def test_resource_linker_resolves_pkg_name_from_caller_module(
     result = runner.invoke(link_cli, [])
 
     assert result.exit_code == 0
-    _assert_linked(tmp_path / '.repolish' / 'mylib', pkg_root / 'resources')
+    _assert_linked(tmp_path / _DEFAULT_TARGET, pkg_root / 'resources')
@@ -35,7 +35,7 @@ def test_static_provider_registers_and_is_ready(
     assert result.failed == []
     info_file = get_provider_info_path('lib', tmp_path)
     assert info_file.exists()
-    saved = json.loads(info_file.read_text())
+    saved = json.loads(info_file.read_bytes())
     assert saved['provider_root'] == str(provider_root)
 
 
@@ -51,7 +51,7 @@ def test_static_provider_defaults_resources_dir_to_provider_root(
     providers = {'lib': ProviderConfig(provider_root=str(provider_root))}
     ensure_providers_ready(['lib'], providers, tmp_path, force=True)
 
-    saved = json.loads(get_provider_info_path('lib', tmp_path).read_text())
+    saved = json.loads(get_provider_info_path('lib', tmp_path).read_bytes())
     assert saved['resources_dir'] == str(provider_root)
 
 
@@ -73,7 +73,7 @@ def test_static_provider_uses_explicit_resources_dir(
     }
     ensure_providers_ready(['lib'], providers, tmp_path, force=True)
 
-    saved = json.loads(get_provider_info_path('lib', tmp_path).read_text())
+    saved = json.loads(get_provider_info_path('lib', tmp_path).read_bytes())
     assert saved['resources_dir'] == str(resources)
 
 
@@ -1,11 +1,13 @@
+from __future__ import annotations
+
 import io
 import json
 import subprocess
+from dataclasses import dataclass
 from pathlib import Path
-from unittest.mock import MagicMock
+from typing import TYPE_CHECKING
 
 import pytest
-import pytest_mock
 from rich.console import Console
 
 from repolish.commands.link import (
@@ -29,79 +31,101 @@ from repolish.linker import (
 )
 from repolish.linker.orchestrator import _load_provider_default_symlinks
 from repolish.providers.models.workspace import MemberInfo, WorkspaceContext
+from tests.linker._fs_helpers import assert_copied_file
+from tests.linker.conftest import FakeSubprocessRun, provider_file_info
+from tests.support.fs import write_files
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from unittest.mock import MagicMock
+
+    from pytest_mock import MockerFixture
+
+# Failure modes of a provider link CLI, shared by the parametrized tests.
+_LINK_FAILED = subprocess.CalledProcessError(1, 'mylib-link')
+_CLI_NOT_FOUND = FileNotFoundError('not found')
+
+
+@pytest.fixture
+def mock_run_provider_link(mocker: MockerFixture) -> MagicMock:
+    """Patch `run_provider_link` where the orchestrator calls it."""
+    return mocker.patch('repolish.linker.orchestrator.run_provider_link')
+
+
+@pytest.fixture(
+    params=[None, _LINK_FAILED, _CLI_NOT_FOUND],
+    ids=['success', 'link_failed', 'cli_not_found'],
+)
+def provider_link_error(
+    request: pytest.FixtureRequest,
+    mock_run_provider_link: MagicMock,
+) -> Exception | None:
+    """Make the patched `run_provider_link` succeed or raise, once per param."""
+    mock_run_provider_link.side_effect = request.param
+    return request.param
+
+
+# `--info` output shared by the run_provider_link tests, encoded once.
+_PROVIDER_INFO_JSON = json.dumps(
+    {
+        'resources_dir': '.repolish/mylib',
+        'site_package_dir': '/fake/source/mylib',
+    },
+)
+_INFO_RESULT = subprocess.CompletedProcess(
+    ['mylib-link', '--info'],
+    0,
+    stdout=_PROVIDER_INFO_JSON,
+)
 
 
 @pytest.mark.parametrize(
-    ('exception', 'should_raise'),
+    'exception',
     [
-        (None, False),  # Success case
-        (subprocess.CalledProcessError(1, 'mylib-link'), True),  # Command fails
+        None,  # Success case
+        _LINK_FAILED,  # Command fails
     ],
+    ids=['success', 'called_process_error'],
 )
 def test_run_provider_link_error_handling(
     exception: subprocess.CalledProcessError | None,
-    *,
-    should_raise: bool,
-    mocker: pytest_mock.MockerFixture,
+    fake_subprocess_run: FakeSubprocessRun,
 ):
     """Test run_provider_link handles success and failure cases."""
-    provider_info_data = {
-        'resources_dir': '.repolish/mylib',
-        'site_package_dir': '/fake/source/mylib',
-    }
-
-    mock_run = mocker.patch('subprocess.run')
-
     if exception is None:
         # Success case
-        mock_info = MagicMock()
-        mock_info.stdout = json.dumps(provider_info_data)
-        mock_link = MagicMock()
-        mock_run.side_effect = [mock_info, mock_link]
+        fake_subprocess_run.results = [_INFO_RESULT]
 
         result = run_provider_link('mylib', 'mylib-link')
 
         assert isinstance(result, ProviderFileInfo)
         assert result.resources_dir == '.repolish/mylib'
-        assert mock_run.call_count == 2
+        assert len(fake_subprocess_run.calls) == 2
 
         # Verify --info call
-        first_call = mock_run.call_args_list[0]
-        assert first_call[0][0] == ['mylib-link', '--info']
-        assert first_call[1]['capture_output'] is True
-        assert first_call[1]['text'] is True
-        assert first_call[1]['check'] is True
+        info_args, info_kwargs = fake_subprocess_run.calls[0]
+        assert info_args == ['mylib-link', '--info']
+        assert info_kwargs['capture_output'] is True
+        assert info_kwargs['text'] is True
+        assert info_kwargs['check'] is True
 
         # Verify link call
-        second_call = mock_run.call_args_list[1]
-        assert second_call[0][0] == ['mylib-link']
-        assert second_call[1]['check'] is True
+        link_args, link_kwargs = fake_subprocess_run.calls[1]
+        assert link_args == ['mylib-link']
+        assert link_kwargs['check'] is True
     else:
         # Error case
-        mock_run.side_effect = exception
+        fake_subprocess_run.results = [exception]
 
-        if should_raise:
-            with pytest.raises(type(exception)):
-                run_provider_link('mylib', 'mylib-link')
-        else:
-            result = run_provider_link('mylib', 'mylib-link')
-            assert isinstance(result, ProviderFileInfo)
+        with pytest.raises(type(exception)):
+            run_provider_link('mylib', 'mylib-link')
 
 
 def test_run_provider_link_passes_location_context(
-    mocker: pytest_mock.MockerFixture,
+    fake_subprocess_run: FakeSubprocessRun,
 ):
     """run_provider_link passes REPOLISH_LINK_CONTEXT env var when location_context is set."""
-    provider_info_data = {
-        'resources_dir': '.repolish/mylib',
-        'site_package_dir': '/fake/source/mylib',
-    }
-
-    mock_run = mocker.patch('subprocess.run')
-    mock_info = MagicMock()
-    mock_info.stdout = json.dumps(provider_info_data)
-    mock_link = MagicMock()
-    mock_run.side_effect = [mock_info, mock_link]
+    fake_subprocess_run.results = [_INFO_RESULT]
 
     result = run_provider_link(
         'mylib',
@@ -110,35 +134,26 @@ def test_run_provider_link_passes_location_context(
     )
 
     assert isinstance(result, ProviderFileInfo)
-    assert mock_run.call_count == 2
+    assert len(fake_subprocess_run.calls) == 2
 
     # Verify both calls include the env var
-    for call in mock_run.call_args_list:
-        assert 'env' in call[1]
-        assert call[1]['env']['REPOLISH_LINK_CONTEXT'] == 'packages/pkg_a'
+    for _, kwargs in fake_subprocess_run.calls:
+        assert 'env' in kwargs
+        assert kwargs['env']['REPOLISH_LINK_CONTEXT'] == 'packages/pkg_a'
 
 
 def test_run_provider_link_without_location_context(
-    mocker: pytest_mock.MockerFixture,
+    fake_subprocess_run: FakeSubprocessRun,
 ):
     """run_provider_link does not pass env var when location_context is None."""
-    provider_info_data = {
-        'resources_dir': '.repolish/mylib',
-        'site_package_dir': '/fake/source/mylib',
-    }
-
-    mock_run = mocker.patch('subprocess.run')
-    mock_info = MagicMock()
-    mock_info.stdout = json.dumps(provider_info_data)
-    mock_link = MagicMock()
-    mock_run.side_effect = [mock_info, mock_link]
+    fake_subprocess_run.results = [_INFO_RESULT]
 
     result = run_provider_link('mylib', 'mylib-link', location_context=None)
 
     assert isinstance(result, ProviderFileInfo)
     # Verify env is not passed when location_context is None
-    for call in mock_run.call_args_list:
-        assert 'env' not in call[1] or call[1].get('env') is None
+    for _, kwargs in fake_subprocess_run.calls:
+        assert kwargs.get('env') is None
 
 
 def test_create_provider_symlinks_no_symlinks(tmp_path: Path):
@@ -149,19 +164,12 @@ def test_create_provider_symlinks_no_symlinks(tmp_path: Path):
 
 def test_create_provider_symlinks_creates_links(
     tmp_path: Path,
+    provider_tmp: Path,
     monkeypatch: pytest.MonkeyPatch,
 ):
     """Test create_provider_symlinks creates symlinks from config."""
     monkeypatch.chdir(tmp_path)
 
-    # Setup provider resources
-    provider_dir = tmp_path / '.repolish' / 'mylib'
-    provider_dir.mkdir(parents=True)
-    config_dir = provider_dir / 'configs'
-    config_dir.mkdir()
-    (config_dir / '.editorconfig').write_text('root = true')
-    (config_dir / '.prettierrc').write_text('{}')
-
     symlinks = [
         ProviderSymlink(
             source=Path('configs/.editorconfig'),
@@ -173,7 +181,7 @@ def test_create_provider_symlinks_creates_links(
         ),
     ]
 
-    create_provider_symlinks('mylib', provider_dir, symlinks)
+    create_provider_symlinks('mylib', provider_tmp, symlinks)
 
     # Verify symlinks/copies were created
     assert (tmp_path / '.editorconfig').exists()
@@ -182,138 +190,161 @@ def test_create_provider_symlinks_creates_links(
     assert (tmp_path / '.prettierrc').read_text() == '{}'
 
 
-def test_get_provider_names_with_order():
-    """Test _get_provider_names returns providers_order when set."""
-    config = RepolishConfigFile(
+_EXPECTED_NAMES_WITHOUT_ORDER: frozenset[str] = frozenset(('lib1', 'lib2', 'local'))
+
+
+# _get_provider_names is pure, so its configs are built once per module
+# (without validation) and shared read-only between tests.
+@pytest.fixture(scope='module')
+def ordered_config() -> RepolishConfigFile:
+    """Config with an explicit `providers_order`."""
+    return RepolishConfigFile.model_construct(
         providers_order=['lib1', 'lib2', 'lib3'],
+        providers={f'lib{i}': ProviderConfig.model_construct(cli=f'lib{i}-link') for i in (1, 2, 3)},
+    )
+
+
+@pytest.fixture(scope='module')
+def unordered_config() -> RepolishConfigFile:
+    """Config without `providers_order`, mixing CLI and local providers."""
+    return RepolishConfigFile.model_construct(
         providers={
-            'lib1': ProviderConfig(cli='lib1-link'),
-            'lib2': ProviderConfig(cli='lib2-link'),
-            'lib3': ProviderConfig(cli='lib3-link'),
+            'lib1': ProviderConfig.model_construct(cli='lib1-link'),
+            'lib2': ProviderConfig.model_construct(cli='lib2-link'),
+            'local': ProviderConfig.model_construct(provider_root='./templates'),
         },
     )
 
-    result = _get_provider_names(config)
+
+def test_get_provider_names_with_order(ordered_config: RepolishConfigFile):
+    """Test _get_provider_names returns providers_order when set."""
+    result = _get_provider_names(ordered_config)
 
     assert result == ['lib1', 'lib2', 'lib3']
 
 
-def test_get_provider_names_without_order():
+def test_get_provider_names_without_order(unordered_config: RepolishConfigFile):
     """Test _get_provider_names returns all providers when no order set."""
-    config = RepolishConfigFile(
-        providers={
-            'lib1': ProviderConfig(cli='lib1-link'),
-            'lib2': ProviderConfig(cli='lib2-link'),
-            'local': ProviderConfig(provider_root='./templates'),
-        },
-    )
-
-    result = _get_provider_names(config)
+    result = _get_provider_names(unordered_config)
 
     # Order is arbitrary but should include all providers
-    assert set(result) == {'lib1', 'lib2', 'local'}
+    assert frozenset(result) == _EXPECTED_NAMES_WITHOUT_ORDER
 
 
-@pytest.mark.parametrize(
-    ('exception', 'expected_result'),
-    [
-        (None, 0),  # Success case
-        (subprocess.CalledProcessError(1, 'cmd'), 1),  # Link command fails
-        (FileNotFoundError('not found'), 1),  # CLI not found
-    ],
-)
 def test_process_single_provider_error_handling(
-    exception: subprocess.CalledProcessError | FileNotFoundError | None,
-    expected_result: int,
+    provider_link_error: Exception | None,
     tmp_path: Path,
-    mocker: pytest_mock.MockerFixture,
+    mock_run_provider_link: MagicMock,
 ):
     """Test process_provider handles various error conditions."""
     provider_config = ProviderConfig(cli='mylib-link')
+    mock_run_provider_link.return_value = provider_file_info(
+        resources_dir=str(tmp_path / '.repolish' / 'mylib'),
+        site_package_dir='/fake/source/mylib',
+    )
 
-    if exception is None:
-        # Success case
-        provider_info = ProviderFileInfo(
-            resources_dir=str(tmp_path / '.repolish' / 'mylib'),
-            site_package_dir='/fake/source/mylib',
-        )
-        _ = mocker.patch(
-            'repolish.linker.orchestrator.run_provider_link',
-            return_value=provider_info,
-        )
-        result = process_provider('mylib', provider_config, tmp_path)
-        assert result == expected_result
-    else:
-        # Error cases
-        _ = mocker.patch(
-            'repolish.linker.orchestrator.run_provider_link',
-            side_effect=exception,
-        )
-        result = process_provider('mylib', provider_config, tmp_path)
-        assert result == expected_result
+    result = process_provider('mylib', provider_config, tmp_path)
+    assert result == (0 if provider_link_error is None else 1)
 
 
-def test_run_no_providers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
-    """Test run handles configs with no providers."""
-    monkeypatch.chdir(tmp_path)
-
-    config_file = tmp_path / 'repolish.yaml'
-    config_file.write_text("""
+# Config bodies are kept as bytes so tests can write them with write_bytes.
+_TEMPLATES_PREAMBLE = b"""
 directories:
   - ./templates
-""")
+"""
+_CONFIG_ONE_PROVIDER = (
+    _TEMPLATES_PREAMBLE
+    + b"""
+providers:
+  mylib:
+    cli: mylib-link
+"""
+)
 
-    # Create dummy template directory
-    (tmp_path / 'templates').mkdir()
-    (tmp_path / 'templates' / 'repolish.py').write_text('# provider')
-    (tmp_path / 'templates' / 'repolish').mkdir()
 
-    result = run_link(config_file)
+@pytest.fixture
+def write_config(tmp_path: Path) -> Callable[[bytes], Path]:
+    """Return a helper that writes `tmp_path/repolish.yaml` and returns its path."""
 
-    assert result == 0
+    def _write(body: bytes) -> Path:
+        config_file = tmp_path / 'repolish.yaml'
+        config_file.write_bytes(body)
+        return config_file
 
+    return _write
 
-def test_run_with_providers(
-    tmp_path: Path,
-    monkeypatch: pytest.MonkeyPatch,
-    mocker: pytest_mock.MockerFixture,
-):
-    """Test run processes providers successfully."""
-    monkeypatch.chdir(tmp_path)
 
-    config_file = tmp_path / 'repolish.yaml'
-    config_file.write_text("""
-directories:
-  - ./templates
+@dataclass
+class RunLinkCase:
+    name: str
+    config_yaml: bytes
+    link_error: Exception | None
+    expected: int
 
-providers:
-  mylib:
-    cli: mylib-link
-""")
 
-    # Create dummy template directory
-    (tmp_path / 'templates').mkdir()
-    (tmp_path / 'templates' / 'repolish.py').write_text('# provider')
-    (tmp_path / 'templates' / 'repolish').mkdir()
+@pytest.mark.parametrize(
+    'case',
+    [
+        RunLinkCase(
+            name='no_providers',
+            config_yaml=_TEMPLATES_PREAMBLE,
+            link_error=None,
+            expected=0,
+        ),
+        RunLinkCase(
+            name='with_providers',
+            config_yaml=_CONFIG_ONE_PROVIDER,
+            link_error=None,
+            expected=0,
+        ),
+        RunLinkCase(
+            # Should succeed despite missing provider in order
+            name='provider_not_in_order',
+            config_yaml=_TEMPLATES_PREAMBLE
+            + b"""
+providers_order: [lib1, lib2, nonexistent]
+
+providers:
+  lib1:
+    cli: lib1-link
+  lib2:
+    cli: lib2-link
+""",
+            link_error=None,
+            expected=0,
+        ),
+        RunLinkCase(
+            name='provider_fails',
+            config_yaml=_CONFIG_ONE_PROVIDER,
+            link_error=_LINK_FAILED,
+            expected=1,
+        ),
+    ],
+    ids=lambda case: case.name,
+)
+def test_run_link(
+    tmp_path: Path,
+    write_config: Callable[[bytes], Path],
+    mock_run_provider_link: MagicMock,
+    case: RunLinkCase,
+):
+    """Test run links CLI providers and reports failures."""
+    config_file = write_config(case.config_yaml)
 
-    provider_info = ProviderFileInfo(
+    mock_run_provider_link.return_value = provider_file_info(
         resources_dir=str(tmp_path / '.repolish' / 'mylib'),
         site_package_dir='/fake/source/mylib',
     )
-
-    mocker.patch(
-        'repolish.linker.orchestrator.run_provider_link',
-        return_value=provider_info,
-    )
+    mock_run_provider_link.side_effect = case.link_error
     result = run_link(config_file)
 
-    assert result == 0
+    assert result == case.expected
 
 
 def test_run_with_directory_provider(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
-    mocker: pytest_mock.MockerFixture,
+    mock_run_provider_link: MagicMock,
 ):
     """Test run processes directory-based providers (no CLI, just directory path)."""
     monkeypatch.chdir(tmp_path)
@@ -332,97 +363,13 @@ providers:
     provider_root: {provider_dir}
 """)
 
-    # Create dummy template directory
-    (tmp_path / 'templates').mkdir()
-    (tmp_path / 'templates' / 'repolish.py').write_text('# provider')
-    (tmp_path / 'templates' / 'repolish').mkdir()
-
-    # Mock should NOT be called since directory providers don't use run_provider_link
-    mock_run_provider_link = mocker.patch(
-        'repolish.linker.orchestrator.run_provider_link',
-    )
-
     result = run_link(config_file)
 
     assert result == 0
-    # Verify run_provider_link was NOT called for directory-based provider
+    # Directory providers don't use run_provider_link
     mock_run_provider_link.assert_not_called()
 
 
-def test_run_provider_not_in_order(
-    tmp_path: Path,
-    monkeypatch: pytest.MonkeyPatch,
-    mocker: pytest_mock.MockerFixture,
-):
-    """Test run handles provider in order but not in providers config."""
-    monkeypatch.chdir(tmp_path)
-
-    config_file = tmp_path / 'repolish.yaml'
-    config_file.write_text("""
-directories:
-  - ./templates
-
-providers_order: [lib1, lib2, nonexistent]
-
-providers:
-  lib1:
-    cli: lib1-link
-  lib2:
-    cli: lib2-link
-""")
-
-    # Create dummy template directory
-    (tmp_path / 'templates').mkdir()
-    (tmp_path / 'templates' / 'repolish.py').write_text('# provider')
-    (tmp_path / 'templates' / 'repolish').mkdir()
-
-    provider_info = ProviderFileInfo(
-        resources_dir=str(tmp_path / '.repolish' / 'lib'),
-        site_package_dir='/fake/source/lib',
-    )
-
-    mocker.patch(
-        'repolish.linker.orchestrator.run_provider_link',
-        return_value=provider_info,
-    )
-    result = run_link(config_file)
-
-    # Should succeed despite missing provider in order
-    assert result == 0
-
-
-def test_run_provider_fails(
-    tmp_path: Path,
-    monkeypatch: pytest.MonkeyPatch,
-    mocker: pytest_mock.MockerFixture,
-):
-    """Test run returns error when provider processing fails."""
-    monkeypatch.chdir(tmp_path)
-
-    config_file = tmp_path / 'repolish.yaml'
-    config_file.write_text("""
-directories:
-  - ./templates
-
-providers:
-  mylib:
-    cli: mylib-link
-""")
-
-    # Create dummy template directory
-    (tmp_path / 'templates').mkdir()
-    (tmp_path / 'templates' / 'repolish.py').write_text('# provider')
-    (tmp_path / 'templates' / 'repolish').mkdir()
-
-    mocker.patch(
-        'repolish.linker.orchestrator.run_provider_link',
-        side_effect=subprocess.CalledProcessError(1, 'cmd'),
-    )
-    result = run_link(config_file)
-
-    assert result == 1
-
-
 def test_save_provider_info(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     """Test that save_provider_info saves provider info correctly."""
     monkeypatch.chdir(tmp_path)
@@ -438,7 +385,7 @@ def test_save_provider_info(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     info_file = tmp_path / '.repolish' / '_' / 'provider-info.mylib.json'
     assert info_file.exists()
 
-    saved_info = json.loads(info_file.read_text())
+    saved_info = json.loads(info_file.read_bytes())
     assert saved_info['resources_dir'] == str(tmp_path / '.repolish' / 'mylib')
     assert saved_info['provider_root'] == ''
 
@@ -462,32 +409,23 @@ def test_save_provider_info_with_alias(
     info_file = tmp_path / '.repolish' / '_' / 'provider-info.base.json'
     assert info_file.exists()
 
-    _ = json.loads(info_file.read_text())
+    _ = json.loads(info_file.read_bytes())
 
     # Alias mapping should also be saved
     alias_file = tmp_path / '.repolish' / '_' / '.all-providers.json'
     assert alias_file.exists()
 
-    aliases = json.loads(alias_file.read_text())
+    aliases = json.loads(alias_file.read_bytes())
     assert 'aliases' in aliases
     assert aliases['aliases']['base'] == 'codeguide'
 
 
 def test_run_provider_link_no_extra_save(
-    mocker: pytest_mock.MockerFixture,
+    fake_subprocess_run: FakeSubprocessRun,
     tmp_path: Path,
 ):
     """Test that run_provider_link doesn't save info (that's done by process_provider)."""
-    provider_info_data = {
-        'resources_dir': '.repolish/mylib',
-        'site_package_dir': '/fake/source/mylib',
-    }
-
-    mock_run = mocker.patch('subprocess.run')
-    mock_info = MagicMock()
-    mock_info.stdout = json.dumps(provider_info_data)
-    mock_link = MagicMock()
-    mock_run.side_effect = [mock_info, mock_link]
+    fake_subprocess_run.results = [_INFO_RESULT]
 
     result = run_provider_link('mylib', 'mylib-link')
 
@@ -495,9 +433,19 @@ def test_run_provider_link_no_extra_save(
     assert result.resources_dir == '.repolish/mylib'
 
 
+_MONOREPO_ROOT_YAML = b"""
+providers:
+  root_lib:
+    cli: root-lib-link
+workspace:
+  members:
+    - packages/*
+"""
+
+
 def _cwd_provider_info(*_args: object, **_kwargs: object) -> ProviderFileInfo:
     """Return a ProviderFileInfo whose resources_dir is under the current working directory."""
-    return ProviderFileInfo(
+    return provider_file_info(
         resources_dir=str(Path.cwd() / '.repolish' / 'lib'),
         site_package_dir='/fake/source/lib',
     )
@@ -505,21 +453,14 @@ def _cwd_provider_info(*_args: object, **_kwargs: object) -> ProviderFileInfo:
 
 def test_run_monorepo_links_root_and_members(
     tmp_path: Path,
+    write_config: Callable[[bytes], Path],
     monkeypatch: pytest.MonkeyPatch,
-    mocker: pytest_mock.MockerFixture,
+    mock_run_provider_link: MagicMock,
 ):
     """command() links root providers then each member's providers."""
     monkeypatch.chdir(tmp_path)
 
-    root_config = tmp_path / 'repolish.yaml'
-    root_config.write_text("""
-providers:
-  root_lib:
-    cli: root-lib-link
-workspace:
-  members:
-    - packages/*
-""")
+    root_config = write_config(_MONOREPO_ROOT_YAML)
 
     for name in ('pkg_a', 'pkg_b'):
         member_dir = tmp_path / 'packages' / name
@@ -530,35 +471,25 @@ providers:
     cli: {name}-lib-link
 """)
 
-    mock_link = mocker.patch(
-        'repolish.linker.orchestrator.run_provider_link',
-        side_effect=_cwd_provider_info,
-    )
+    mock_run_provider_link.side_effect = _cwd_provider_info
 
     result = run_link(root_config)
 
     assert result == 0
     # One call for root + one call per member = 3 total
-    assert mock_link.call_count == 3
+    assert mock_run_provider_link.call_count == 3
 
 
 def test_run_monorepo_member_failure_stops_early(
     tmp_path: Path,
+    write_config: Callable[[bytes], Path],
     monkeypatch: pytest.MonkeyPatch,
-    mocker: pytest_mock.MockerFixture,
+    mock_run_provider_link: MagicMock,
 ):
     """command() returns 1 immediately when a member provider fails."""
     monkeypatch.chdir(tmp_path)
 
-    root_config = tmp_path / 'repolish.yaml'
-    root_config.write_text("""
-providers:
-  root_lib:
-    cli: root-lib-link
-workspace:
-  members:
-    - packages/*
-""")
+    root_config = write_config(_MONOREPO_ROOT_YAML)
 
     for name in ('pkg_a', 'pkg_b'):
         member_dir = tmp_path / 'packages' / name
@@ -578,10 +509,7 @@ providers:
             return _cwd_provider_info()
         raise subprocess.CalledProcessError(1, 'cmd')
 
-    mocker.patch(
-        'repolish.linker.orchestrator.run_provider_link',
-        side_effect=_side_effect,
-    )
+    mock_run_provider_link.side_effect = _side_effect
 
     result = run_link(root_config)
 
@@ -590,21 +518,14 @@ providers:
 
 def test_run_monorepo_skips_member_without_config(
     tmp_path: Path,
+    write_config: Callable[[bytes], Path],
     monkeypatch: pytest.MonkeyPatch,
-    mocker: pytest_mock.MockerFixture,
+    mock_run_provider_link: MagicMock,
 ):
     """command() silently skips member directories that have no repolish.yaml."""
     monkeypatch.chdir(tmp_path)
 
-    root_config = tmp_path / 'repolish.yaml'
-    root_config.write_text("""
-providers:
-  root_lib:
-    cli: root-lib-link
-workspace:
-  members:
-    - packages/*
-""")
+    root_config = write_config(_MONOREPO_ROOT_YAML)
 
     # pkg_a has a config; pkg_b does not.
     pkg_a = tmp_path / 'packages' / 'pkg_a'
@@ -616,16 +537,13 @@ providers:
 """)
     (tmp_path / 'packages' / 'pkg_b').mkdir(parents=True)
 
-    mock_link = mocker.patch(
-        'repolish.linker.orchestrator.run_provider_link',
-        side_effect=_cwd_provider_info,
-    )
+    mock_run_provider_link.side_effect = _cwd_provider_info
 
     result = run_link(root_config)
 
     assert result == 0
     # Root + pkg_a only (pkg_b is skipped)
-    assert mock_link.call_count == 2
+    assert mock_run_provider_link.call_count == 2
 
 
 def test_load_provider_default_symlinks_via_mode_handler(
@@ -667,7 +585,7 @@ from repolish.commands.link import (  # noqa: E402
 
 def test_print_link_tree_with_symlinks(
     tmp_path: Path,
-    mocker: pytest_mock.MockerFixture,
+    mocker: MockerFixture,
 ) -> None:
     """_print_link_tree prints summary when sections contain symlinks."""
     out = io.StringIO()
@@ -692,10 +610,11 @@ def test_print_link_tree_with_symlinks(
     assert '.editorconfig' in output
 
 
-def test_link_config_no_providers(tmp_path: Path) -> None:
+def test_link_config_no_providers(
+    write_config: Callable[[bytes], Path],
+) -> None:
     """_link_config returns (0, {}) immediately when config has no providers."""
-    config_file = tmp_path / 'repolish.yaml'
-    config_file.write_text('providers: {}\n')
+    config_file = write_config(b'providers: {}\n')
     rc, syms = _link_config(config_file)
     assert rc == 0
     assert syms == {}
@@ -704,7 +623,7 @@ def test_link_config_no_providers(tmp_path: Path) -> None:
 def test_link_config_appends_member_section_with_symlinks(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
-    mocker: pytest_mock.MockerFixture,
+    mocker: MockerFixture,
 ) -> None:
     """_link_members appends a section when syms is non-empty."""
     monkeypatch.chdir(tmp_path)
@@ -744,15 +663,13 @@ def test_link_config_appends_member_section_with_symlinks(
 
 def test_command_returns_nonzero_when_root_link_fails(
     tmp_path: Path,
+    write_config: Callable[[bytes], Path],
     monkeypatch: pytest.MonkeyPatch,
-    mocker: pytest_mock.MockerFixture,
+    mocker: MockerFixture,
 ) -> None:
     """command() returns 1 immediately when root provider linking fails in monorepo mode."""
     monkeypatch.chdir(tmp_path)
-    config_file = tmp_path / 'repolish.yaml'
-    config_file.write_text(
-        'providers:\n  root_lib:\n    cli: root-lib-link\nworkspace:\n  members:\n    - packages/*\n',
-    )
+    config_file = write_config(_MONOREPO_ROOT_YAML)
     (tmp_path / 'packages').mkdir()
 
     mocker.patch('repolish.commands.link._link_config', return_value=(1, {}))
@@ -763,15 +680,13 @@ def test_command_returns_nonzero_when_root_link_fails(
 
 def test_command_appends_root_syms_section(
     tmp_path: Path,
+    write_config: Callable[[bytes], Path],
     monkeypatch: pytest.MonkeyPatch,
-    mocker: pytest_mock.MockerFixture,
+    mocker: MockerFixture,
 ) -> None:
     """command() appends a Root section when root_syms is non-empty."""
     monkeypatch.chdir(tmp_path)
-    config_file = tmp_path / 'repolish.yaml'
-    config_file.write_text(
-        'providers:\n  root_lib:\n    cli: root-lib-link\nworkspace:\n  members:\n    - packages/*\n',
-    )
+    config_file = write_config(_MONOREPO_ROOT_YAML)
     (tmp_path / 'packages').mkdir()
 
     sl = ProviderSymlink(
@@ -813,9 +728,7 @@ def test_create_provider_copies_file(
     monkeypatch.chdir(tmp_path)
 
     provider_dir = tmp_path / '.repolish' / 'mylib'
-    configs = provider_dir / 'configs'
-    configs.mkdir(parents=True)
-    (configs / 'dprint.json').write_text('{"plugins":[]}')
+    write_files(provider_dir, {'configs/dprint.json': b'{"plugins":[]}'})
 
     copies = [
         ProviderCopy(
@@ -825,10 +738,7 @@ def test_create_provider_copies_file(
     ]
     create_provider_copies('mylib', provider_dir, copies)
 
-    dest = tmp_path / 'dprint.json'
-    assert dest.exists()
-    assert dest.read_text() == '{"plugins":[]}'
-    assert not dest.is_symlink()
+    assert_copied_file(tmp_path / 'dprint.json', '{"plugins":[]}')
 
 
 def test_create_provider_copies_directory(
@@ -839,9 +749,7 @@ def test_create_provider_copies_directory(
     monkeypatch.chdir(tmp_path)
 
     provider_dir = tmp_path / '.repolish' / 'mylib'
-    src_dir = provider_dir / 'vendors'
-    src_dir.mkdir(parents=True)
-    (src_dir / 'plugin.wasm').write_bytes(b'\x00\x61\x73\x6d')
+    write_files(provider_dir, {'vendors/plugin.wasm': b'\x00\x61\x73\x6d'})
 
     copies = [ProviderCopy(source=Path('vendors'), target=Path('vendors'))]
     create_provider_copies('mylib', provider_dir, copies)
@@ -858,6 +766,7 @@ def test_create_provider_copies_missing_source_raises(
 ) -> None:
     """create_provider_copies raises FileNotFoundError when source is absent."""
     monkeypatch.chdir(tmp_path)
+
     provider_dir = tmp_path / '.repolish' / 'mylib'
     provider_dir.mkdir(parents=True)
 
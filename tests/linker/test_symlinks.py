@@ -1,11 +1,13 @@
-import shutil
+from __future__ import annotations
+
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
-import pytest_mock
-from pytest_mock import MockerFixture
 
 from repolish.linker.symlinks import (
+    _remove_target,
     create_additional_link,
     link_resources,
 )
@@ -13,42 +15,23 @@ from repolish.linker.windows_utils import (
     normalize_windows_path,
     supports_symlinks,
 )
+from tests.linker._fs_helpers import (
+    assert_copied_directory,
+    assert_copied_file,
+    assert_copy_with_file,
+    assert_dangling_symlink,
+    assert_symlink_with_file,
+    create_test_dir,
+)
+from tests.support.fs import write_files
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-def assert_symlink_with_file(target: Path, filename: str, content: str):
-    """Assert that target is a symlink, exists, and contains the expected file with content."""
-    assert target.is_symlink(), f'Expected {target} to be a symlink'
-    assert target.exists(), f'Expected {target} to exist'
-    assert (target / filename).read_text() == content
-
-
-def assert_copied_directory(target: Path):
-    """Assert that target is a copied directory (not symlink)."""
-    assert target.exists(), f'Expected {target} to exist'
-    assert target.is_dir(), f'Expected {target} to be a directory'
-    assert not target.is_symlink(), f'Expected {target} to not be a symlink'
-
-
-def assert_copy_with_file(target: Path, filename: str, content: str):
-    """Assert that target is a copy (not symlink), exists, and contains the expected file with content."""
-    assert_copied_directory(target)
-    assert (target / filename).read_text() == content
+    from pytest_mock import MockerFixture
 
 
-def create_test_dir(
-    tmp_path: Path,
-    name: str,
-    filename: str = 'content.txt',
-    content: str = 'content',
-) -> Path:
-    """Create a test directory with a file inside."""
-    test_dir = tmp_path / name
-    test_dir.mkdir()
-    (test_dir / filename).write_text(content)
-    return test_dir
-
-
-def mock_no_symlinks(mocker: pytest_mock.MockerFixture):
+def mock_no_symlinks(mocker: MockerFixture):
     """Mock supports_symlinks to return False for both linker modules."""
     mocker.patch(
         'repolish.linker.symlinks.supports_symlinks',
@@ -81,8 +64,7 @@ def test_link_resources_skips_existing_target_without_force(
 ):
     """Test link_resources skips linking when target exists and force=False."""
     target = tmp_path / 'target'
-    target.mkdir()
-    (target / 'existing.txt').write_text('existing')
+    write_files(target, {'existing.txt': b'existing'})
 
     # Should skip and return whether target is a symlink
     result = link_resources(source_with_file, target, force=False)
@@ -99,8 +81,7 @@ def test_link_resources_replaces_existing_target_with_force(
 ):
     """Test link_resources replaces target when force=True."""
     target = tmp_path / 'target'
-    target.mkdir()
-    (target / 'old.txt').write_text('old')
+    write_files(target, {'old.txt': b'old'})
 
     result = link_resources(source_with_file, target, force=True)
 
@@ -133,8 +114,7 @@ def test_link_resources_copies_when_symlinks_not_supported(
     mock_no_symlinks(mocker)
 
     source = tmp_path / 'source'
-    source.mkdir()
-    (source / 'file.txt').write_text('content')
+    write_files(source, {'file.txt': b'content'})
 
     target = tmp_path / 'target'
 
@@ -146,20 +126,14 @@ def test_link_resources_copies_when_symlinks_not_supported(
 
 def test_create_additional_link_file(
     tmp_path: Path,
+    provider_tmp: Path,
     monkeypatch: pytest.MonkeyPatch,
-    provider_resources_setup: Path,
 ):
     """Test create_additional_link creates a link for a file."""
     monkeypatch.chdir(tmp_path)
 
-    # Setup config file
-    config_dir = provider_resources_setup / 'configs'
-    config_dir.mkdir()
-    config_file = config_dir / '.editorconfig'
-    config_file.write_text('root = true')
-
     result = create_additional_link(
-        resources_dir=provider_resources_setup,
+        resources_dir=provider_tmp,
         provider_name='mylib',
         source='configs/.editorconfig',
         target='.editorconfig',
@@ -173,19 +147,14 @@ def test_create_additional_link_file(
 
 def test_create_additional_link_directory(
     tmp_path: Path,
+    provider_tmp: Path,
     monkeypatch: pytest.MonkeyPatch,
-    provider_resources_setup: Path,
 ):
     """Test create_additional_link creates a link for a directory."""
     monkeypatch.chdir(tmp_path)
 
-    # Setup docs directory
-    docs_dir = provider_resources_setup / 'docs'
-    docs_dir.mkdir()
-    (docs_dir / 'README.md').write_text('# Docs')
-
     result = create_additional_link(
-        resources_dir=provider_resources_setup,
+        resources_dir=provider_tmp,
         provider_name='mylib',
         source='docs',
         target='documentation',
@@ -199,24 +168,19 @@ def test_create_additional_link_directory(
 
 def test_create_additional_link_target_exists_without_force(
     tmp_path: Path,
+    provider_tmp: Path,
     monkeypatch: pytest.MonkeyPatch,
 ):
     """Test create_additional_link raises when target exists and force=False."""
-    # Setup provider resources
-    provider_resources = tmp_path / '.repolish' / 'mylib'
-    provider_resources.mkdir(parents=True)
-    config_file = provider_resources / 'config.txt'
-    config_file.write_text('new')
+    monkeypatch.chdir(tmp_path)
 
     # Create existing target
     target_path = tmp_path / 'config.txt'
     target_path.write_text('existing')
 
-    monkeypatch.chdir(tmp_path)
-
     with pytest.raises(FileExistsError, match='Target already exists'):
         create_additional_link(
-            resources_dir=provider_resources,
+            resources_dir=provider_tmp,
             provider_name='mylib',
             source='config.txt',
             target='config.txt',
@@ -226,23 +190,18 @@ def test_create_additional_link_target_exists_without_force(
 
 def test_create_additional_link_replaces_target_with_force(
     tmp_path: Path,
+    provider_tmp: Path,
     monkeypatch: pytest.MonkeyPatch,
 ):
     """Test create_additional_link replaces target when force=True."""
     monkeypatch.chdir(tmp_path)
 
-    # Setup provider resources
-    provider_resources = tmp_path / '.repolish' / 'mylib'
-    provider_resources.mkdir(parents=True)
-    config_file = provider_resources / 'config.txt'
-    config_file.write_text('new content')
-
     # Create existing target
     target_path = tmp_path / 'config.txt'
     target_path.write_text('old content')
 
     result = create_additional_link(
-        resources_dir=provider_resources,
+        resources_dir=provider_tmp,
         provider_name='mylib',
         source='config.txt',
         target='config.txt',
@@ -251,24 +210,19 @@ def test_create_additional_link_replaces_target_with_force(
 
     assert isinstance(result, bool)
     assert target_path.exists()
-    assert target_path.read_text() == 'new content'
+    assert target_path.read_text() == 'content'
 
 
 def test_create_additional_link_creates_parent_directories(
     tmp_path: Path,
+    provider_tmp: Path,
     monkeypatch: pytest.MonkeyPatch,
 ):
     """Test create_additional_link creates parent directories for target."""
     monkeypatch.chdir(tmp_path)
 
-    # Setup provider resources
-    provider_resources = tmp_path / '.repolish' / 'mylib'
-    provider_resources.mkdir(parents=True)
-    config_file = provider_resources / 'config.txt'
-    config_file.write_text('content')
-
     result = create_additional_link(
-        resources_dir=provider_resources,
+        resources_dir=provider_tmp,
         provider_name='mylib',
         source='config.txt',
         target='nested/deep/config.txt',
@@ -283,52 +237,39 @@ def test_create_additional_link_creates_parent_directories(
 def test_create_additional_link_copies_when_no_symlinks(
     mocker: MockerFixture,
     tmp_path: Path,
+    provider_tmp: Path,
     monkeypatch: pytest.MonkeyPatch,
 ):
     """Test create_additional_link copies when symlinks aren't supported."""
     monkeypatch.chdir(tmp_path)
-    mock_no_symlinks(mocker)
 
-    # Setup provider resources
-    provider_resources = tmp_path / '.repolish' / 'mylib'
-    provider_resources.mkdir(parents=True)
-    config_file = provider_resources / 'config.txt'
-    config_file.write_text('content')
+    mock_no_symlinks(mocker)
 
     result = create_additional_link(
-        resources_dir=provider_resources,
+        resources_dir=provider_tmp,
         provider_name='mylib',
         source='config.txt',
         target='config.txt',
     )
 
     assert result is False  # Should return False when copying
-    target_path = tmp_path / 'config.txt'
-    assert target_path.exists()
-    assert not target_path.is_symlink()
-    assert target_path.read_text() == 'content'
+    assert_copied_file(tmp_path / 'config.txt', 'content')
 
 
 def test_create_additional_link_directory_copies_when_no_symlinks(
     tmp_path: Path,
+    provider_tmp: Path,
+    mocker: MockerFixture,
     monkeypatch: pytest.MonkeyPatch,
-    mocker: pytest_mock.MockerFixture,
 ):
     """Test create_additional_link copies directory when symlinks not supported."""
-    provider_resources = tmp_path / '.repolish' / 'mylib'
-    provider_resources.mkdir(parents=True)
-    configs_dir = provider_resources / 'configs'
-    configs_dir.mkdir()
-    (configs_dir / 'file1.txt').write_text('content1')
-    (configs_dir / 'file2.txt').write_text('content2')
-
     monkeypatch.chdir(tmp_path)
 
     # Mock supports_symlinks to return False
     mock_no_symlinks(mocker)
 
     is_symlink = create_additional_link(
-        resources_dir=provider_resources,
+        resources_dir=provider_tmp,
         provider_name='mylib',
         source='configs',
         target='configs',
@@ -338,8 +279,8 @@ def test_create_additional_link_directory_copies_when_no_symlinks(
     assert not is_symlink
     target_path = tmp_path / 'configs'
     assert_copied_directory(target_path)
-    assert (target_path / 'file1.txt').read_text() == 'content1'
-    assert (target_path / 'file2.txt').read_text() == 'content2'
+    assert (target_path / '.editorconfig').read_text() == 'root = true'
+    assert (target_path / '.prettierrc').read_text() == '{}'
 
 
 def test_link_resources_with_broken_symlink_target(tmp_path: Path):
@@ -368,10 +309,11 @@ def test_link_resources_with_broken_symlink_target(tmp_path: Path):
 
     # Step 2: Delete the source (fileA) - now fileB is a broken symlink
 
-    shutil.rmtree(file_a)
+    # create_test_dir wrote exactly one file
+    (file_a / 'content.txt').unlink()
+    file_a.rmdir()
     assert not file_a.exists()
-    assert file_b.is_symlink()  # Still a symlink
-    assert not file_b.exists()  # But broken (points to non-existent target)
+    assert_dangling_symlink(file_b)
 
     # Step 3: Create fileC and try to create symlink from fileC to fileB
     file_c = create_test_dir(tmp_path, 'fileC', content='from C')
@@ -426,6 +368,50 @@ def test_link_resources_replace_valid_symlink(tmp_path: Path):
     assert_symlink_with_file(file_b, 'content.txt', 'from C')
 
 
+def test_link_resources_repoints_symlink_in_place(tmp_path: Path):
+    """An outdated symlink is swapped via rename without touching neighbours."""
+    if not supports_symlinks() or os.name == 'nt':
+        pytest.skip('Atomic symlink replacement needs POSIX symlinks')
+
+    file_a = create_test_dir(tmp_path, 'fileA', content='from A')
+    file_c = create_test_dir(tmp_path, 'fileC', content='from C')
+    target = tmp_path / 'target'
+    target.symlink_to(file_a, target_is_directory=True)
+    # A user file next to the target (named like the old fixed staging path) must survive
+    bystander = tmp_path / 'target.repolish-new'
+    bystander.write_text('mine')
+
+    result = link_resources(file_c, target)
+
+    assert result is True
+    assert_symlink_with_file(target, 'content.txt', 'from C')
+    assert bystander.read_text() == 'mine'
+    assert not list(tmp_path.glob('.target.*.repolish-new'))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['fileA', 'fileC', 'target', 'target.repolish-new']
+
+
+def test_link_resources_swap_failure_removes_staged_link(
+    mocker: MockerFixture,
+    tmp_path: Path,
+):
+    """A failed rename removes the staged link and re-raises."""
+    if not supports_symlinks() or os.name == 'nt':
+        pytest.skip('Atomic symlink replacement needs POSIX symlinks')
+
+    file_a = create_test_dir(tmp_path, 'fileA', content='from A')
+    file_c = create_test_dir(tmp_path, 'fileC', content='from C')
+    target = tmp_path / 'target'
+    target.symlink_to(file_a, target_is_directory=True)
+    mocker.patch.object(Path, 'replace', side_effect=OSError('rename failed'))
+
+    with pytest.raises(OSError, match='rename failed'):
+        link_resources(file_c, target)
+
+    assert not list(tmp_path.glob('.target.*.repolish-new'))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['fileA', 'fileC', 'target']
+    assert_symlink_with_file(target, 'content.txt', 'from A')
+
+
 def test_link_resources_handles_symlink_readlink_error(
     mocker: MockerFixture,
     tmp_path: Path,
@@ -510,3 +496,43 @@ def test_link_resources_updates_outdated_copy_without_symlinks(
     (source_a / 'file.txt').write_text('version 3')
     result = link_resources(source_a, target, force=False)
     assert (target / 'file.txt').read_text() == 'version 3'  # Always fresh!
+
+
+def _make_symlink_target(base: Path) -> Path:
+    source = base / 'source'
+    source.mkdir()
+    target = base / 'target'
+    target.symlink_to(source, target_is_directory=True)
+    return target
+
+
+def _make_directory_target(base: Path) -> Path:
+    target = base / 'target'
+    write_files(target, {'nested/file.txt': b'content'})
+    return target
+
+
+def _make_file_target(base: Path) -> Path:
+    target = base / 'target'
+    target.write_text('content')
+    return target
+
+
+# Builders for each kind of existing target `_remove_target` must clear.
+_TARGET_SETUPS: dict[str, Callable[[Path], Path]] = {
+    'symlink': _make_symlink_target,
+    'directory': _make_directory_target,
+    'file': _make_file_target,
+    'nonexistent': lambda base: base / 'target',
+}
+
+
+@pytest.mark.parametrize('target_name', list(_TARGET_SETUPS))
+def test_remove_target(tmp_path: Path, target_name: str):
+    """_remove_target clears any kind of target and tolerates a missing one."""
+    target = _TARGET_SETUPS[target_name](tmp_path)
+
+    _remove_target(target)
+
+    # lexists is a single lstat and also sees dangling links
+    assert not os.path.lexists(target)
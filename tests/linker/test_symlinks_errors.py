@@ -1,9 +1,18 @@
-from pathlib import Path
+from __future__ import annotations
+
+import shutil
+from typing import TYPE_CHECKING
 
 import pytest
 
 from repolish.exceptions import SymlinkError
 from repolish.linker.symlinks import create_additional_link, link_resources
+from tests.support.fs import write_files
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
 
 
 def test_link_resources_source_not_exists(tmp_path: Path):
@@ -39,3 +48,43 @@ def test_create_additional_link_source_not_exists(
             source='nonexistent/file.txt',
             target='target.txt',
         )
+
+
+def test_link_resources_copy_fallback_reports_file_copy_error(
+    tmp_path: Path,
+    source_with_file: Path,
+    mocker: MockerFixture,
+):
+    """A failing file copy surfaces from link_resources as `shutil.Error`."""
+    mocker.patch('repolish.linker.symlinks.supports_symlinks', return_value=False)
+    mocker.patch(
+        'repolish.linker.symlinks.shutil.copy',
+        side_effect=PermissionError('denied'),
+    )
+
+    with pytest.raises(shutil.Error, match='denied'):
+        link_resources(source_with_file, tmp_path / 'target')
+
+
+def test_link_resources_copy_fallback_handles_read_only_source(
+    tmp_path: Path,
+    mocker: MockerFixture,
+):
+    """Copying a read-only source directory still copies every file.
+
+    `copytree` copies directory modes onto the destination, so a directory
+    must only become read-only once all of its files are in place.
+    """
+    mocker.patch('repolish.linker.symlinks.supports_symlinks', return_value=False)
+    source = tmp_path / 'source'
+    write_files(source, {f'sub/f{i}': str(i) for i in range(50)})
+    (source / 'sub').chmod(0o555)
+    target = tmp_path / 'target'
+    try:
+        assert link_resources(source, target) is False
+        assert sorted(p.name for p in (target / 'sub').iterdir()) == sorted(f'f{i}' for i in range(50))
+        assert (target / 'sub' / 'f7').read_text() == '7'
+    finally:
+        (source / 'sub').chmod(0o755)
+        if (target / 'sub').exists():
+            (target / 'sub').chmod(0o755)
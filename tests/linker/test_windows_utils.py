@@ -1,25 +1,37 @@
 import os
-from unittest.mock import patch
+from collections.abc import Generator
+
+import pytest
 
 from repolish.linker.windows_utils import supports_symlinks
 
 
+@pytest.fixture(autouse=True)
+def _fresh_supports_symlinks() -> Generator[None, None, None]:
+    """Keep the cached supports_symlinks result from leaking between tests."""
+    supports_symlinks.cache_clear()
+    yield
+    supports_symlinks.cache_clear()
+
+
 def test_supports_symlinks():
     """Test that supports_symlinks returns a boolean."""
     result = supports_symlinks()
     assert isinstance(result, bool)
 
 
-def test_supports_symlinks_when_os_lacks_symlink_attribute():
+def test_supports_symlinks_when_os_lacks_symlink_attribute(
+    monkeypatch: pytest.MonkeyPatch,
+):
     """Test supports_symlinks when os.symlink attribute doesn't exist."""
-    # Mock hasattr to return False for os.symlink
-    original_hasattr = hasattr
+    monkeypatch.delattr(os, 'symlink', raising=False)
+
+    assert supports_symlinks() is False
+
 
-    def mock_hasattr(obj: object, name: str) -> bool:
-        if obj is os and name == 'symlink':
-            return False
-        return original_hasattr(obj, name)
+def test_supports_symlinks_is_cached(monkeypatch: pytest.MonkeyPatch):
+    """The first answer is reused even if the environment changes later."""
+    first = supports_symlinks()
+    monkeypatch.delattr(os, 'symlink', raising=False)
 
-    with patch('builtins.hasattr', side_effect=mock_hasattr):
-        result = supports_symlinks()
-        assert result is False
+    assert supports_symlinks() is first
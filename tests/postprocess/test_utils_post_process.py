@@ -45,9 +45,9 @@ def test__run_argv_output_suppressed_on_success(
 ):
     """By default (verbosity 0) subprocess stdout is captured (not inherited)."""
     configure_logging(verbosity=resolve_verbosity(verbose=0))
-    mock_run = mocker.patch('repolish.utils.subprocess.run')
-    mock_run.return_value = mocker.Mock(returncode=0, stdout=None)
     argv = [sys.executable, '-c', 'print("hello")']
+    mock_run = mocker.patch('repolish.utils.subprocess.run')
+    mock_run.return_value = subprocess.CompletedProcess(argv, 0, stdout=None)
     utils._run_argv(argv, tmp_path)
     _, kwargs = mock_run.call_args
     assert kwargs['stdout'] == subprocess.PIPE
@@ -61,14 +61,14 @@ def test__run_argv_output_shown_on_failure(
     """On failure the captured output is flushed to stdout regardless of verbosity."""
     configure_logging(verbosity=resolve_verbosity(verbose=0))
     fake_output = b'error details\n'
-    mock_run = mocker.patch('repolish.utils.subprocess.run')
-    mock_run.return_value = mocker.Mock(returncode=1, stdout=fake_output)
-    mock_write = mocker.patch('sys.stdout.buffer.write')
     argv = [
         sys.executable,
         '-c',
         'print("error details"); import sys; sys.exit(1)',
     ]
+    mock_run = mocker.patch('repolish.utils.subprocess.run')
+    mock_run.return_value = subprocess.CompletedProcess(argv, 1, stdout=fake_output)
+    mock_write = mocker.patch('sys.stdout.buffer.write')
     with pytest.raises(subprocess.CalledProcessError):
         utils._run_argv(argv, tmp_path)
     mock_write.assert_any_call(fake_output)
@@ -81,9 +81,9 @@ def test__run_argv_output_inherited_when_verbose(
     """With verbosity >= 1 subprocess stdout is inherited (stdout=None)."""
     configure_logging(verbosity=resolve_verbosity(verbose=1))
     try:
-        mock_run = mocker.patch('repolish.utils.subprocess.run')
-        mock_run.return_value = mocker.Mock(returncode=0, stdout=None)
         argv = [sys.executable, '-c', 'print("verbose output")']
+        mock_run = mocker.patch('repolish.utils.subprocess.run')
+        mock_run.return_value = subprocess.CompletedProcess(argv, 0, stdout=None)
         utils._run_argv(argv, tmp_path)
         _, kwargs = mock_run.call_args
         assert kwargs['stdout'] is None
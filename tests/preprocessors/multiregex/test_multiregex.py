@@ -1,11 +1,13 @@
 """Tests for multiregex preprocessor functionality."""
 
+import re
 from dataclasses import dataclass
 from textwrap import dedent
 
 import pytest
 
 from repolish.preprocessors.multiregex import (
+    _compile_pattern,
     _extract_block_content,
     _extract_values_from_block,
     _is_key_value_line,
@@ -275,3 +277,11 @@ def test_is_key_value_line_invalid():
     assert not _is_key_value_line('[section]')
     assert not _is_key_value_line('# comment')
     assert not _is_key_value_line('key = value')  # no quotes
+
+
+def test_compile_pattern_reuses_compiled_patterns():
+    """The same pattern string and flags yield the same compiled object."""
+    first = _compile_pattern(r'^\[tools\](.*?)(?=\n\[|\Z)', re.DOTALL | re.MULTILINE)
+
+    assert _compile_pattern(r'^\[tools\](.*?)(?=\n\[|\Z)', re.DOTALL | re.MULTILINE) is first
+    assert _compile_pattern(r'^\[tools\](.*?)(?=\n\[|\Z)', re.MULTILINE) is not first
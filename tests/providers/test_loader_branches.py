@@ -6,6 +6,74 @@ import pytest
 from repolish.providers import create_providers
 from repolish.providers.models.files import TemplateMapping
 
+# Provider sources, dedented once at import.
+_SRC_ANCHORS_WRONG_TYPE = dedent(
+    """
+    from repolish import BaseContext, Provider, BaseInputs
+
+    class Ctx(BaseContext):
+        pass
+
+    class P(Provider[Ctx, BaseInputs]):
+        def create_context(self):
+            return Ctx()
+
+        def create_anchors(self, context=None):
+            return ('not', 'a', 'dict')
+    """,
+)
+
+_SRC_DELETE_A = dedent(
+    """
+    from repolish import BaseContext, Provider, BaseInputs, TemplateMapping, FileMode
+
+    class Ctx(BaseContext):
+        pass
+
+    class P1(Provider[Ctx, BaseInputs]):
+        def create_context(self):
+            return Ctx()
+
+        def create_file_mappings(self, context=None):
+            return {'a.txt': TemplateMapping(source_template=None, file_mode=FileMode.DELETE)}
+    """,
+)
+
+_SRC_KEEP_A_DELETE_B = dedent(
+    """
+    from repolish import BaseContext, Provider, BaseInputs, TemplateMapping, FileMode
+
+    class Ctx(BaseContext):
+        pass
+
+    class P2(Provider[Ctx, BaseInputs]):
+        def create_context(self):
+            return Ctx()
+
+        def create_file_mappings(self, context=None):
+            return {
+                'a.txt': TemplateMapping(source_template=None, file_mode=FileMode.KEEP),
+                'b.txt': TemplateMapping(source_template=None, file_mode=FileMode.DELETE),
+            }
+    """,
+)
+
+_SRC_NONE_MAPPING = dedent(
+    """
+    from repolish import BaseContext, Provider, BaseInputs
+
+    class Ctx(BaseContext):
+        pass
+
+    class P(Provider[Ctx, BaseInputs]):
+        def create_context(self):
+            return Ctx()
+
+        def create_file_mappings(self, context=None):
+            return {'dest.txt': None, 'x.txt': 'y.txt'}
+    """,
+)
+
 
 def write_provider(tmp_path: Path, src: str) -> str:
     d = tmp_path / 'prov'
@@ -16,62 +84,14 @@ def write_provider(tmp_path: Path, src: str) -> str:
 
 def test_create_anchors_wrong_type_raises(tmp_path: Path):
     """create_anchors() returning a non-dict raises TypeError."""
-    src = dedent(
-        """
-        from repolish import BaseContext, Provider, BaseInputs
-
-        class Ctx(BaseContext):
-            pass
-
-        class P(Provider[Ctx, BaseInputs]):
-            def create_context(self):
-                return Ctx()
-
-            def create_anchors(self, context=None):
-                return ('not', 'a', 'dict')
-        """,
-    )
     with pytest.raises(TypeError):
-        create_providers([write_provider(tmp_path, src)])
+        create_providers([write_provider(tmp_path, _SRC_ANCHORS_WRONG_TYPE)])
 
 
 def test_delete_files_negation_and_history(tmp_path: Path):
     """A later provider can cancel a delete via FileMode.KEEP and provenance is tracked."""
-    src1 = dedent(
-        """
-        from repolish import BaseContext, Provider, BaseInputs, TemplateMapping, FileMode
-
-        class Ctx(BaseContext):
-            pass
-
-        class P1(Provider[Ctx, BaseInputs]):
-            def create_context(self):
-                return Ctx()
-
-            def create_file_mappings(self, context=None):
-                return {'a.txt': TemplateMapping(source_template=None, file_mode=FileMode.DELETE)}
-        """,
-    )
-    src2 = dedent(
-        """
-        from repolish import BaseContext, Provider, BaseInputs, TemplateMapping, FileMode
-
-        class Ctx(BaseContext):
-            pass
-
-        class P2(Provider[Ctx, BaseInputs]):
-            def create_context(self):
-                return Ctx()
-
-            def create_file_mappings(self, context=None):
-                return {
-                    'a.txt': TemplateMapping(source_template=None, file_mode=FileMode.KEEP),
-                    'b.txt': TemplateMapping(source_template=None, file_mode=FileMode.DELETE),
-                }
-        """,
-    )
-    p1 = write_provider(tmp_path / 'p1', src1)
-    p2 = write_provider(tmp_path / 'p2', src2)
+    p1 = write_provider(tmp_path / 'p1', _SRC_DELETE_A)
+    p2 = write_provider(tmp_path / 'p2', _SRC_KEEP_A_DELETE_B)
 
     providers = create_providers([p1, p2])
     got = {Path(p) for p in providers.delete_files}
@@ -85,22 +105,7 @@ def test_delete_files_negation_and_history(tmp_path: Path):
 
 def test_file_mappings_none_values_are_filtered(tmp_path: Path):
     """None values returned from create_file_mappings() are silently ignored."""
-    src = dedent(
-        """
-        from repolish import BaseContext, Provider, BaseInputs
-
-        class Ctx(BaseContext):
-            pass
-
-        class P(Provider[Ctx, BaseInputs]):
-            def create_context(self):
-                return Ctx()
-
-            def create_file_mappings(self, context=None):
-                return {'dest.txt': None, 'x.txt': 'y.txt'}
-        """,
-    )
-    providers = create_providers([write_provider(tmp_path, src)])
+    providers = create_providers([write_provider(tmp_path, _SRC_NONE_MAPPING)])
     assert 'dest.txt' not in providers.file_mappings
     tm = providers.file_mappings.get('x.txt')
     assert isinstance(tm, TemplateMapping)
@@ -1,3 +1,7 @@
+from dataclasses import dataclass
+from unittest.mock import MagicMock
+
+import pytest
 from pydantic import BaseModel, field_validator
 from pytest_mock import MockerFixture
 
@@ -9,7 +13,13 @@ from repolish.providers.context import (
 from repolish.providers.models import BaseContext
 
 
-def test_apply_context_overrides(mocker: MockerFixture):
+@pytest.fixture
+def context_logger(mocker: MockerFixture) -> MagicMock:
+    """Patch the logger of `repolish.providers.context` and return the mock."""
+    return mocker.patch('repolish.providers.context.logger')
+
+
+def test_apply_context_overrides(context_logger: MagicMock):
     # include a plain object to prove that overrides only work on dict/list
     class Repo(BaseModel):
         owner: str
@@ -37,7 +47,6 @@ def test_apply_context_overrides(mocker: MockerFixture):
         'direct_list.1': 'replaced',  # Direct list index replacement
         'repo.name': 'new_name',  # should not touch Repo instance
     }
-    mock_logger = mocker.patch('repolish.providers.context.logger')
     apply_context_overrides(context, overrides)
     assert context['devkits'][0]['name'] == 'new-d1'
     assert context['simple'] == 'new-value'
@@ -47,9 +56,9 @@ def test_apply_context_overrides(mocker: MockerFixture):
 
     # object fields are untouched; we logged a warning when traversal failed
     assert context['repo'].name == 'original'
-    assert mock_logger.warning.call_count >= 4
+    assert context_logger.warning.call_count >= 4
     # one warning should be for navigating into our Repo object
-    assert any(call.kwargs.get('current_type') == 'Repo' for call in mock_logger.warning.call_args_list)
+    assert any(call.kwargs.get('current_type') == 'Repo' for call in context_logger.warning.call_args_list)
 
 
 def test_apply_context_overrides_nested_dict():
@@ -91,16 +100,14 @@ def test_apply_context_overrides_nested_dict():
     assert context['other_provider']['config'] == 'overridden'
 
 
-def test_apply_override_edge_cases(mocker: MockerFixture):
+def test_apply_override_edge_cases(context_logger: MagicMock):
     """Test edge cases in _apply_override function."""
-    mock_logger = mocker.patch('repolish.providers.context.logger')
-
     # Test empty path_parts (should return early)
     context = {'test': 'value'}
     _apply_override(context, [], 'new-value')
     # Should not modify context and not log warnings
     assert context == {'test': 'value'}
-    assert mock_logger.warning.call_count == 0
+    assert context_logger.warning.call_count == 0
 
 
 def test_apply_context_overrides_dotted_keys_in_nested_dict():
@@ -124,56 +131,83 @@ def test_apply_context_overrides_dotted_keys_in_nested_dict():
     assert context['base']['codeguides']['base']['ref'] == 'some-ref'
 
 
-def test_apply_overrides_to_model_helper(mocker: MockerFixture):
+class _PlainCtx(BaseContext):
+    a: int = 0
+
+
+class _BumpedCtx(BaseContext):
+    a: int = 0
+
+    @field_validator('a', mode='after')
+    @classmethod
+    def bump(cls, v: int) -> int:
+        return v + 10
+
+
+@dataclass
+class OverrideModelCase:
+    name: str
+    model: type[BaseContext]
+    overrides: dict[str, object]
+    expected_a: int
+    # Event logged as a warning, or None when nothing should be logged.
+    warning: str | None = None
+    # Whether the original instance is returned unchanged.
+    same_instance: bool = False
+
+
+@pytest.mark.parametrize(
+    'case',
+    [
+        OverrideModelCase(
+            name='valid_field',
+            model=_PlainCtx,
+            overrides={'a': 5},
+            expected_a=5,
+        ),
+        # a validator that transforms the value without dropping the key must
+        # not warn (a previous implementation logged ignored_keys=[])
+        OverrideModelCase(
+            name='validator_transforms_value',
+            model=_BumpedCtx,
+            overrides={'a': 1},
+            expected_a=11,
+        ),
+        # unknown fields are logged; the data is unchanged but identity is
+        # not guaranteed because the model was re-validated
+        OverrideModelCase(
+            name='unknown_field',
+            model=_PlainCtx,
+            overrides={'b': 1},
+            expected_a=0,
+            warning='context_override_ignored',
+        ),
+        OverrideModelCase(
+            name='bad_type',
+            model=_PlainCtx,
+            overrides={'a': 'nope'},
+            expected_a=0,
+            warning='context_override_validation_failed',
+            same_instance=True,
+        ),
+    ],
+    ids=lambda case: case.name,
+)
+def test_apply_overrides_to_model_helper(
+    context_logger: MagicMock,
+    case: OverrideModelCase,
+):
     """Helper should return a new model when overrides apply and warn on failure."""
-
-    class M(BaseContext):
-        a: int = 0
-
-    instance = M()
-
-    mock_logger = mocker.patch('repolish.providers.context.logger')
-
-    # override valid field
-    new = _apply_overrides_to_model(instance, {'a': 5}, provider='pid')
-    assert isinstance(new, M)
-    assert new.a == 5
-    assert mock_logger.warning.call_count == 0
-
-    # if the model transforms the value during validation but does not drop
-    # the key we also should not warn (previous implementation would log
-    # ignored_keys=[]). this simulates more complex Pydantic behaviour.
-    class N(BaseContext):
-        a: int = 0
-
-        @field_validator('a', mode='after')
-        @classmethod
-        def bump(cls, v: int) -> int:
-            return v + 10
-
-    ninst = N()
-    mock_logger.reset_mock()
-    nout = _apply_overrides_to_model(ninst, {'a': 1}, provider='pid')
-    assert isinstance(nout, N)
-    assert nout.a == 11  # validator applied
-    assert mock_logger.warning.call_count == 0
-
-    # override invalid field should log but still produce a model with
-    # identical data (identity isn't guaranteed because we re-validated).
-    mock_logger.reset_mock()
-    out = _apply_overrides_to_model(instance, {'b': 1}, provider='pid')
-    assert isinstance(out, M)
-    assert out.a == instance.a
-    assert mock_logger.warning.call_count == 1
-    assert 'context_override_ignored' in str(
-        mock_logger.warning.call_args[0][0],
-    )
-
-    # override with bad type triggers validation failure
-    mock_logger.reset_mock()
-    out2 = _apply_overrides_to_model(instance, {'a': 'nope'}, provider='pid')
-    assert out2 is instance
-    assert mock_logger.warning.call_count == 1
-    assert 'context_override_validation_failed' in str(
-        mock_logger.warning.call_args[0][0],
-    )
+    instance = case.model()
+
+    out = _apply_overrides_to_model(instance, case.overrides, provider='pid')
+
+    assert isinstance(out, case.model)
+    assert out.model_dump()['a'] == case.expected_a
+    if case.same_instance:
+        assert out is instance
+    if case.warning is None:
+        assert context_logger.warning.call_count == 0
+    else:
+        assert context_logger.warning.call_count == 1
+        assert context_logger.warning.call_args[0][0] == case.warning
@@ -5,10 +5,125 @@ import pytest
 from pydantic import BaseModel
 
 from repolish.providers import FileMode, TemplateMapping, create_providers
+from tests.support.fs import write_files
+
+# Provider sources, dedented once at import and written to disk once per
+# module by `provider_dirs`.
+_SRC_MERGED_CONTEXT = dedent(
+    """
+    from repolish import BaseContext, Provider, BaseInputs
+
+    class Ctx(BaseContext):
+        readme_ext: str = 'txt'
+
+    class P(Provider[Ctx, BaseInputs]):
+        def create_context(self):
+            return Ctx()
+
+        def create_file_mappings(self, context=None):
+            # global context is available via typed attribute
+            assert context.repolish.repo.owner == 'owner'
+            ext = context.readme_ext
+            return {f'README.{ext}': 'README_template'}
+    """,
+)
+
+_SRC_PYDANTIC_EXTRA_CONTEXT = dedent(
+    """
+    from pydantic import BaseModel
+    from repolish import BaseContext, Provider, BaseInputs, TemplateMapping
+
+    class ItemCtx(BaseModel):
+        file_number: int
+
+    class Ctx(BaseContext):
+        pass
+
+    class P(Provider[Ctx, BaseInputs]):
+        def create_context(self):
+            return Ctx()
+
+        def create_file_mappings(self, context=None):
+            return {'typed.txt': TemplateMapping('template.jinja', ItemCtx(file_number=7))}
+    """,
+)
+
+_SRC_CREATE_ONLY = dedent(
+    """
+    from repolish import BaseContext, Provider, BaseInputs, TemplateMapping, FileMode
+
+    class Ctx(BaseContext):
+        pass
+
+    class P(Provider[Ctx, BaseInputs]):
+        def create_context(self):
+            return Ctx()
+
+        def create_file_mappings(self, context=None):
+            return {'a.txt': TemplateMapping('template.jinja', None, FileMode.CREATE_ONLY)}
+    """,
+)
+
+_SRC_DELETE = dedent(
+    """
+    from repolish import BaseContext, Provider, BaseInputs, TemplateMapping, FileMode
+
+    class Ctx(BaseContext):
+        pass
+
+    class P(Provider[Ctx, BaseInputs]):
+        def create_context(self):
+            return Ctx()
+
+        def create_file_mappings(self, context=None):
+            return {'old.txt': TemplateMapping(None, None, FileMode.DELETE)}
+    """,
+)
+
+_SRC_TEMPLATES_ROOT = dedent(
+    """
+    from repolish import BaseContext, Provider, BaseInputs
+
+    class Ctx(BaseContext):
+        pass
+
+    class P(Provider[Ctx, BaseInputs]):
+        def create_context(self):
+            return Ctx()
+
+        def create_file_mappings(self, context=None):
+            # expose templates_root as the mapping value so the test can inspect it
+            return {'__templates_root__': str(self.templates_root)}
+    """,
+)
+
+_PROVIDER_SOURCES: dict[str, str] = {
+    'merged_context': _SRC_MERGED_CONTEXT,
+    'pydantic_extra_context': _SRC_PYDANTIC_EXTRA_CONTEXT,
+    'create_only': _SRC_CREATE_ONLY,
+    'delete': _SRC_DELETE,
+    'templates_root': _SRC_TEMPLATES_ROOT,
+}
+
+
+def _fixed_owner_repo() -> tuple[str, str]:
+    """Stand-in for `_get_owner_repo` so the global context is predictable."""
+    return ('owner', 'repo')
+
+
+@pytest.fixture(scope='module')
+def provider_dirs(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """Write every provider in `_PROVIDER_SOURCES` once for the whole module.
+
+    The tests only read the provider directories, so sharing them is safe.
+    """
+    root = tmp_path_factory.mktemp('mapping-providers')
+    write_files(root, {f'{name}/repolish.py': src for name, src in _PROVIDER_SOURCES.items()})
+    return {name: root / name for name in _PROVIDER_SOURCES}
 
 
 def test_file_mappings_receive_merged_context(
-    tmp_path: Path,
+    provider_dirs: dict[str, Path],
     monkeypatch: pytest.MonkeyPatch,
 ):
     """A provider may use the merged context when creating file mappings.
@@ -23,66 +138,21 @@ def test_file_mappings_receive_merged_context(
     # ensure global context is predictable
     monkeypatch.setattr(
         'repolish.providers.models.context._get_owner_repo',
-        lambda: ('owner', 'repo'),
+        _fixed_owner_repo,
     )
 
-    src = dedent(
-        """
-        from repolish import BaseContext, Provider, BaseInputs
-
-        class Ctx(BaseContext):
-            readme_ext: str = 'txt'
-
-        class P(Provider[Ctx, BaseInputs]):
-            def create_context(self):
-                return Ctx()
-
-            def create_file_mappings(self, context=None):
-                # global context is available via typed attribute
-                assert context.repolish.repo.owner == 'owner'
-                ext = context.readme_ext
-                return {f'README.{ext}': 'README_template'}
-        """,
-    )
-
-    provider = tmp_path / 'prov'
-    provider.mkdir()
-    (provider / 'repolish.py').write_text(src)
-
-    providers = create_providers([str(provider)])
+    providers = create_providers([str(provider_dirs['merged_context'])])
 
     tm = providers.file_mappings.get('README.txt')
     assert isinstance(tm, TemplateMapping)
     assert tm.source_template == 'README_template'
 
 
-def test_create_file_mappings_accepts_pydantic_extra_context(tmp_path: Path):
+def test_create_file_mappings_accepts_pydantic_extra_context(
+    provider_dirs: dict[str, Path],
+):
     """create_file_mappings() may return a `TemplateMapping` with a Pydantic model as extra_context."""
-    src = dedent(
-        """
-        from pydantic import BaseModel
-        from repolish import BaseContext, Provider, BaseInputs, TemplateMapping
-
-        class ItemCtx(BaseModel):
-            file_number: int
-
-        class Ctx(BaseContext):
-            pass
-
-        class P(Provider[Ctx, BaseInputs]):
-            def create_context(self):
-                return Ctx()
-
-            def create_file_mappings(self, context=None):
-                return {'typed.txt': TemplateMapping('template.jinja', ItemCtx(file_number=7))}
-        """,
-    )
-
-    provider = tmp_path / 'prov'
-    provider.mkdir()
-    (provider / 'repolish.py').write_text(src)
-
-    providers = create_providers([str(provider)])
+    providers = create_providers([str(provider_dirs['pydantic_extra_context'])])
 
     # The mapping should be preserved as a TemplateMapping instance until hydration.
     # The source_template keeps the original path, but logical_name strips .jinja.
@@ -96,87 +166,30 @@ def test_create_file_mappings_accepts_pydantic_extra_context(tmp_path: Path):
 
 
 def test_template_mapping_file_mode_create_only_includes_in_create_only(
-    tmp_path: Path,
+    provider_dirs: dict[str, Path],
 ):
-    src = dedent(
-        """
-        from repolish import BaseContext, Provider, BaseInputs, TemplateMapping, FileMode
-
-        class Ctx(BaseContext):
-            pass
-
-        class P(Provider[Ctx, BaseInputs]):
-            def create_context(self):
-                return Ctx()
-
-            def create_file_mappings(self, context=None):
-                return {'a.txt': TemplateMapping('template.jinja', None, FileMode.CREATE_ONLY)}
-        """,
-    )
-
-    provider = tmp_path / 'prov'
-    provider.mkdir()
-    (provider / 'repolish.py').write_text(src)
-
-    providers = create_providers([str(provider)])
+    providers = create_providers([str(provider_dirs['create_only'])])
 
     # Destination should be marked as create-only and mapping preserved
-    assert Path('a.txt') in {Path(p) for p in providers.create_only_files}
+    assert Path('a.txt') in providers.create_only_files
     val = providers.file_mappings.get('a.txt')
     assert isinstance(val, TemplateMapping)
     assert val.file_mode == FileMode.CREATE_ONLY
 
 
-def test_template_mapping_file_mode_delete_marks_for_deletion(tmp_path: Path):
-    src = dedent(
-        """
-        from repolish import BaseContext, Provider, BaseInputs, TemplateMapping, FileMode
-
-        class Ctx(BaseContext):
-            pass
-
-        class P(Provider[Ctx, BaseInputs]):
-            def create_context(self):
-                return Ctx()
-
-            def create_file_mappings(self, context=None):
-                return {'old.txt': TemplateMapping(None, None, FileMode.DELETE)}
-        """,
-    )
-
-    provider = tmp_path / 'prov'
-    provider.mkdir()
-    (provider / 'repolish.py').write_text(src)
-
-    providers = create_providers([str(provider)])
+def test_template_mapping_file_mode_delete_marks_for_deletion(
+    provider_dirs: dict[str, Path],
+):
+    providers = create_providers([str(provider_dirs['delete'])])
 
     # Should be recorded in delete_files and not present in file_mappings
-    assert Path('old.txt') in {Path(p) for p in providers.delete_files}
+    assert Path('old.txt') in providers.delete_files
     assert 'old.txt' not in providers.file_mappings
 
 
-def test_provider_templates_root_is_injected(tmp_path: Path) -> None:
+def test_provider_templates_root_is_injected(provider_dirs: dict[str, Path]) -> None:
     """templates_root is set to the provider directory before any hooks are called."""
-    src = dedent(
-        """
-        from repolish import BaseContext, Provider, BaseInputs
-
-        class Ctx(BaseContext):
-            pass
-
-        class P(Provider[Ctx, BaseInputs]):
-            def create_context(self):
-                return Ctx()
-
-            def create_file_mappings(self, context=None):
-                # expose templates_root as the mapping value so the test can inspect it
-                return {'__templates_root__': str(self.templates_root)}
-        """,
-    )
-
-    provider_dir = tmp_path / 'myprov'
-    provider_dir.mkdir()
-    (provider_dir / 'repolish.py').write_text(src)
+    provider_dir = provider_dirs['templates_root']
 
     providers = create_providers([str(provider_dir)])
 
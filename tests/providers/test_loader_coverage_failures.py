@@ -1,9 +1,7 @@
 from pathlib import Path
-from typing import cast
 
 import pydantic_core
 import pytest
-from pytest_mock import MockerFixture
 
 from repolish.hydration.rendering import (
     _BinaryFile,
@@ -41,6 +39,20 @@ class BadInst(_ProviderBase[BaseContext, BaseInputs]):
         raise RuntimeError
 
 
+_EMPTY_CONTEXT = BaseContext()
+
+
+class FailingFinalize(_ProviderBase[BaseContext, BaseInputs]):
+    def create_context(self) -> BaseContext:
+        return _EMPTY_CONTEXT
+
+    def finalize_context(
+        self,
+        opt: FinalizeContextOptions[BaseContext, BaseInputs],
+    ) -> BaseContext:
+        raise RuntimeError
+
+
 def test_schema_matches_returns_false_on_incompatible_model() -> None:
     """A model with incompatible fields does not match the schema."""
 
@@ -85,21 +97,11 @@ def test_validate_raw_inputs_wrong_model() -> None:
 
 
 def test_finalize_provider_contexts_error_path() -> None:
-    class F(_ProviderBase[BaseContext, BaseInputs]):
-        def create_context(self) -> BaseContext:
-            return BaseContext()
-
-        def finalize_context(
-            self,
-            opt: FinalizeContextOptions[BaseContext, BaseInputs],
-        ) -> BaseContext:
-            raise RuntimeError
-
-    provider_contexts = cast('dict[str, list[BaseInputs]]', {'p': [1]})
+    provider_contexts: dict[str, list[BaseInputs]] = {'p': [1]}  # type: ignore[list-item]
     with pytest.raises(RuntimeError):
         finalize_provider_contexts(
             [('p', {})],
-            [F()],
+            [FailingFinalize()],
             provider_contexts,
             {},
             [],
@@ -130,21 +132,24 @@ def test_load_and_validate_template_handles_binary_file(
     assert 'dest' in providers.file_mappings
 
 
-def test_load_and_validate_template_handles_oserror(
-    tmp_path: Path,
-    mocker: MockerFixture,
-):
-    """An OSError raised by read_text should remove the mapping and return None."""
-    template_file = tmp_path / 'bad.txt'
-    template_file.write_text('ok', encoding='utf-8')
+class _UnreadableTemplate:
+    """Template path stand-in that exists but fails to read."""
+
+    def exists(self) -> bool:
+        return True
+
+    def read_text(self, encoding: str) -> str:
+        msg = f'disk error reading as {encoding}'
+        raise OSError(msg)
 
+
+def test_load_and_validate_template_handles_oserror():
+    """An OSError raised by read_text should remove the mapping and return None."""
     providers = SessionBundle()
     providers.file_mappings['dest'] = TemplateMapping(source_template='bad.txt')
 
-    mocker.patch.object(Path, 'read_text', side_effect=OSError('disk error'))
-
     result = _load_and_validate_template(
-        template_file,
+        _UnreadableTemplate(),  # type: ignore[arg-type]
         providers.file_mappings,
         'dest',
     )
@@ -1,17 +1,13 @@
 from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
 from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
 from pydantic import BaseModel
 
-if TYPE_CHECKING:
-    from pytest_mock import MockerFixture
 from repolish import ProviderEntry
-from repolish.config import RepolishConfig, ResolvedProviderInfo
-from repolish.hydration.context import build_final_providers
 from repolish.misc import ctx_keys, ctx_to_dict
 from repolish.providers import (
     BaseContext,
@@ -60,77 +56,89 @@ class DummyProvider(_ProviderBase[BaseContext, BaseInputs]):
         return BaseContext()
 
 
-def test_process_file_mappings_skips_none_values() -> None:
-    """Ensure `None` mapping entries are silently skipped."""
-    acc2 = Accumulators()
-    _process_provider_fm('m', {'a.txt': None, 'b.txt': 'tmpl'}, acc2)
-    assert list(acc2.merged_file_mappings) == ['b.txt']
-    mapping = acc2.merged_file_mappings['b.txt']
-    assert isinstance(mapping, TemplateMapping)
-    assert mapping.source_template == 'tmpl'
+class _FiveCtx(BaseContext):
+    x: int = 5
 
 
-# ---- orchestrator helpers --------------------------------------------------
+class _NoCreateProvider(DummyProvider):
+    def create_context(self) -> BaseContext:
+        msg = 'create_context must not be called'
+        raise AssertionError(msg)
 
 
-def test_process_provider_fm_skips_none_values() -> None:
-    """Ensure `None` mapping entries are silently skipped by `_process_provider_fm`."""
-    acc = Accumulators()
-    _process_provider_fm('m', {'a.txt': None, 'b.txt': 'tmpl'}, acc)
-    assert list(acc.merged_file_mappings) == ['b.txt']
-    mapping = acc.merged_file_mappings['b.txt']
-    assert isinstance(mapping, TemplateMapping)
-    assert mapping.source_template == 'tmpl'
+class _BrokenProvider(DummyProvider):
+    def get_inputs_schema(self) -> type[BaseInputs]:
+        msg = 'broken get_inputs_schema'
+        raise RuntimeError(msg)
+
+    def create_context(self) -> BaseContext:
+        msg = 'broken create_context'
+        raise RuntimeError(msg)
+
+
+_FINALIZED_CONTEXT = BaseContext()
+
 
+class _FinalizeSetter(DummyProvider):
+    def finalize_context(
+        self,
+        opt: FinalizeContextOptions[BaseContext, BaseInputs],
+    ) -> BaseContext:
+        return _FINALIZED_CONTEXT
 
-def test_process_provider_fm_none_populates_suppressed_sources() -> None:
+
+@pytest.fixture
+def accum() -> Accumulators:
+    """A fresh, empty `Accumulators` workspace for each test."""
+    return Accumulators()
+
+
+@pytest.mark.parametrize(
+    ('suppressed', 'kept'),
+    [
+        ('a.txt', 'b.txt'),
+        ('.github/workflows/_ci-checks.yaml', 'other.txt'),
+    ],
+    ids=['plain', 'nested_path'],
+)
+def test_process_provider_fm_skips_none_values(
+    accum: Accumulators,
+    suppressed: str,
+    kept: str,
+) -> None:
     """A None-valued mapping entry is added to suppressed_sources, not file_mappings."""
-    acc = Accumulators()
-    _process_provider_fm(
-        'm',
-        {'.github/workflows/_ci-checks.yaml': None, 'other.txt': 'tmpl'},
-        acc,
-    )
-    assert '.github/workflows/_ci-checks.yaml' in acc.suppressed_sources
-    assert '.github/workflows/_ci-checks.yaml' not in acc.merged_file_mappings
-    assert list(acc.merged_file_mappings) == ['other.txt']
-    mapping = acc.merged_file_mappings['other.txt']
+    _process_provider_fm('m', {suppressed: None, kept: 'tmpl'}, accum)
+    assert suppressed in accum.suppressed_sources
+    assert list(accum.merged_file_mappings) == [kept]
+    mapping = accum.merged_file_mappings[kept]
     assert isinstance(mapping, TemplateMapping)
     assert mapping.source_template == 'tmpl'
 
 
-def test_collect_provider_contributions_skips_missing_instance():
-    acc = Accumulators()
+# ---- orchestrator helpers --------------------------------------------------
+
+
+def test_collect_provider_contributions_skips_missing_instance(accum: Accumulators):
     # module_cache entry with no instance
-    collect_provider_contributions([('p', {})], {}, acc)
+    collect_provider_contributions([('p', {})], {}, accum)
     # nothing should have changed
-    assert acc.merged_anchors == {}
-    assert acc.merged_file_mappings == {}
+    assert accum.merged_anchors == {}
+    assert accum.merged_file_mappings == {}
 
 
 def test_apply_overrides_to_model_noop_returns_original() -> None:
     """When overrides don't change any value the original instance is returned."""
-
-    class Ctx(BaseContext):
-        x: int = 5
-
-    ctx = Ctx()
+    ctx = _FiveCtx()
     result = _apply_overrides_to_model(ctx, {'x': 5})
     assert result is ctx
 
 
 def test_synthesize_provider_context_skips_already_populated() -> None:
     """When `provider_contexts[pid]` already holds a `BaseContext` the function exits early."""
-
-    class Sentinel(DummyProvider):
-        def create_context(self) -> BaseContext:
-            msg = 'create_context must not be called'
-            raise AssertionError(msg)
-
     existing = BaseContext()
     provider_contexts: dict[str, BaseContext] = {'p': existing}
     _synthesize_provider_context_for_pid(
-        Sentinel(),
+        _NoCreateProvider(),
         'p',
         provider_contexts,
         GlobalContext(),
@@ -148,17 +156,7 @@ def test_build_all_providers_list_swallows_broken_schema(
     * `get_inputs_schema` raising -> `input_type=None`
     * `create_context` raising  -> provider_contexts is left unchanged
     """
-
-    class BrokenProvider(DummyProvider):
-        def get_inputs_schema(self) -> type[BaseInputs]:
-            msg = 'broken get_inputs_schema'
-            raise RuntimeError(msg)
-
-        def create_context(self) -> BaseContext:
-            msg = 'broken create_context'
-            raise RuntimeError(msg)
-
-    inst = BrokenProvider()
+    inst = _BrokenProvider()
     module_cache = [('bp', {})]
     instances: list[_ProviderBase | None] = [inst]
     provider_contexts: dict[str, BaseContext] = {}
@@ -183,81 +181,80 @@ def test_build_all_providers_list_swallows_broken_schema(
         GlobalContext(),
     )
     assert mock_warn.call_count == 1
-    assert 'provider_create_context_raised' in str(mock_warn.call_args[0][0])
+    assert mock_warn.call_args.args[0] == 'provider_create_context_raised'
     assert 'bp' not in provider_contexts
 
 
 # ---- exchange helpers ------------------------------------------------------
 
 
-def test_ctx_to_dict_behaves_consistently():
-    class M(BaseModel):
-        x: int
-
-    # BaseModel -> dict
-    assert ctx_to_dict(M(x=1)) == {'x': 1}
-    # dict passes through
-    assert ctx_to_dict({'a': 2}) == {'a': 2}
-    # None becomes empty dict
-    assert ctx_to_dict(None) == {}
-    # other types fallback to empty dict (safety)
-    assert ctx_to_dict(123) == {}
-
+class _CtxModel(BaseModel):
+    x: int
+    y: str = 'z'
 
-def test_ctx_keys_helper():
-    class M(BaseModel):
-        x: int
-        y: str = 'z'
 
-    # BaseModel -> list of keys
-    assert set(ctx_keys(M(x=5))) == {'x', 'y'}
-    # dict behaves as dict keys
-    assert ctx_keys({'foo': 1, 'bar': 2}) == ['foo', 'bar']
-    # None and other types give empty list
-    assert ctx_keys(None) == []
-    assert ctx_keys(123) == []
-
-
-def test_gather_received_inputs_variants() -> None:
+@pytest.mark.parametrize(
+    ('ctx', 'expected'),
+    [
+        (_CtxModel(x=1), {'x': 1, 'y': 'z'}),
+        ({'a': 2}, {'a': 2}),
+        (None, {}),
+        (123, {}),  # other types fall back to an empty dict (safety)
+    ],
+    ids=['model', 'dict', 'none', 'other'],
+)
+def test_ctx_to_dict_behaves_consistently(ctx: object, expected: dict) -> None:
+    assert ctx_to_dict(ctx) == expected
+
+
+@pytest.mark.parametrize(
+    ('ctx', 'expected'),
+    [
+        (_CtxModel(x=5), ['x', 'y']),
+        ({'foo': 1, 'bar': 2}, ['foo', 'bar']),
+        (None, []),
+        (123, []),
+    ],
+    ids=['model', 'dict', 'none', 'other'],
+)
+def test_ctx_keys_helper(ctx: object, expected: list[str]) -> None:
+    assert ctx_keys(ctx) == expected
+
+
+def _send_foo(ctx: dict, allp: list, idx: int) -> list:
+    return [{'foo': 1}]
+
+
+# new API uses ProviderEntry rather than a raw tuple; a minimal entry has a
+# plain dict context and no declared schema. gather_received_inputs only
+# reads it, so one list serves every case.
+_P1_ENTRIES = [
+    ProviderEntry(
+        provider_id='p1',
+        alias='p1',
+        context={},
+        input_type=None,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    'module_cache',
+    [
+        # provider has no recipients after it
+        [('p1', {})],
+        # module-level sender whose recipient is unresolved; it is dropped
+        [('p2', {'provide_inputs': _send_foo})],
+    ],
+    ids=['no_recipient', 'unresolved_recipient'],
+)
+def test_gather_received_inputs_variants(
+    module_cache: list[tuple[str, dict]],
+) -> None:
     """Cover module path both with and without recipients after."""
-    # provider1 has no recipients after (flag False)
-    module_cache = [('p1', {})]
     # annotate so the type checker knows we intend the broader provider union
     instances: list[_ProviderBase | None] = [None]
-    provider_contexts: dict[str, BaseContext] = {}
-    # new API now uses ProviderEntry rather than a raw tuple.  we can
-    # construct a minimal entry; context is a plain dict and no schema is
-    # declared.
-    all_providers_list = [
-        ProviderEntry(
-            provider_id='p1',
-            alias='p1',
-            context={},
-            input_type=None,
-        ),
-    ]
-    # calling gather_received_inputs directly
-    got = gather_received_inputs(
-        module_cache,
-        instances,
-        provider_contexts,
-        all_providers_list,
-    )
-    assert got == {}
-
-    # now provider with recipient after and a collect function
-
-    def send(ctx: dict, allp: list, idx: int) -> list:
-        return [{'foo': 1}]
-
-    module_cache = [('p2', {'provide_inputs': send})]
-    got = gather_received_inputs(
-        module_cache,
-        instances,
-        provider_contexts,
-        all_providers_list,
-    )
-    # unresolved recipient dropped, so result remains empty
+    got = gather_received_inputs(module_cache, instances, {}, _P1_ENTRIES)
     assert got == {}
 
 
@@ -342,6 +339,11 @@ class Receiver(Provider[RecCtx, Msg]):
     # should therefore omit those keys entirely.  final provider
     # directories are exactly the paths returned by the loader; no extra
     # subdir is appended or expected.
+    # imported here: repolish.hydration pulls in the rendering stack, which
+    # no other test in this module needs
+    from repolish.config import RepolishConfig, ResolvedProviderInfo  # noqa: PLC0415 - only this test needs it
+    from repolish.hydration.context import build_final_providers  # noqa: PLC0415 - only this test needs it
+
     cfg = RepolishConfig(
         config_dir=tmp_path,
         providers={
@@ -375,30 +377,36 @@ class Receiver(Provider[RecCtx, Msg]):
     receiver_ctx = providers.provider_contexts.get(recv_pid, {})
     # contexts may be BaseModel instances or plain dicts depending on merge
     if isinstance(receiver_ctx, BaseModel):
-        rc = cast('Any', receiver_ctx)
-        assert rc.got == 'overridden'
+        assert receiver_ctx.model_dump()['got'] == 'overridden'
     else:
-        rc2 = cast('dict', receiver_ctx)
-        assert rc2.get('got') == 'overridden'
+        assert receiver_ctx.get('got') == 'overridden'
 
     sender_ctx = providers.provider_contexts.get(send_pid, {})
     if isinstance(sender_ctx, BaseModel):
-        sc = cast('Any', sender_ctx)
-        assert sc.repo.name == 'new_name'
+        assert sender_ctx.model_dump()['repo']['name'] == 'new_name'
     else:
-        sc2 = cast('dict', sender_ctx)
-        assert sc2.get('repo', {}).get('name') == 'new_name'
+        assert sender_ctx.get('repo', {}).get('name') == 'new_name'
 
 
-def test_invalid_override_preserves_model(
-    make_provider: Callable[[str, str], str],
-):
-    """An override that fails validation should not convert the context to a dict.
-
-    The loader logs a warning when an override cannot be applied so that
-    callers know something went wrong (extra field, wrong type, etc.).
-    """
-    src = """
+@dataclass
+class OverrideWarningCase:
+    name: str
+    src: str
+    overrides: dict[str, object]
+    # Warning event expected from repolish.providers.context.logger.
+    warning: str
+    # Provider's own context fields after loading (`repolish` excluded).
+    expected: dict[str, object]
+
+
+@pytest.mark.parametrize(
+    'case',
+    [
+        # a failed validation keeps the original model rather than turning
+        # the context into a dict
+        OverrideWarningCase(
+            name='invalid_type_preserves_model',
+            src="""
 from repolish.providers.models import Provider, BaseContext, BaseInputs
 
 
@@ -409,41 +417,16 @@ class IntCtx(BaseContext):
 class P(Provider[IntCtx, BaseInputs]):
     def create_context(self):
         return IntCtx()
-"""
-    pdir = make_provider(src, 'p')
-    # patch the orchestrator logger so we can observe warnings
-
-    mock_logger = MagicMock()
-    with pytest.MonkeyPatch.context() as mp:
-        mp.setattr(
-            'repolish.providers.context.logger',
-            mock_logger,
-        )
-        providers = create_providers(
-            [pdir],
-            context_overrides={'x': 'not-an-int'},
-        )
-        ctx = next(iter(providers.provider_contexts.values()))
-        assert isinstance(ctx, BaseContext)
-        # cast to Any so we can access the field without type errors
-
-        ctx_typed = cast('Any', ctx)
-        # original value should remain unchanged
-        assert ctx_typed.x == 0
-
-        # we should have logged at least one warning about the failed
-        # override; use the message key as an indicator.
-        assert mock_logger.warning.call_count >= 1
-        assert any(
-            'context_override_validation_failed' in str(call.args[0]) for call in mock_logger.warning.call_args_list
-        )
-
-
-def test_override_unknown_field_logs_warning(
-    make_provider: Callable[[str, str], str],
-):
-    """Override targeting fields that don't exist should be ignored and reported via a warning."""
-    src = """
+""",
+            overrides={'x': 'not-an-int'},
+            warning='context_override_validation_failed',
+            expected={'x': 0},
+        ),
+        # validation silently drops an unknown key, so the warning is about
+        # ignored values rather than a validation error
+        OverrideWarningCase(
+            name='unknown_field_ignored',
+            src="""
 from repolish import Provider, BaseContext, BaseInputs
 
 
@@ -454,25 +437,30 @@ class SimpleCtx(BaseContext):
 class P(Provider[SimpleCtx, BaseInputs]):
     def create_context(self):
         return SimpleCtx()
-"""
-    pdir = make_provider(src, 'p')
-
+""",
+            overrides={'y': 'value'},
+            warning='context_override_ignored',
+            expected={'a': 1},
+        ),
+    ],
+    ids=lambda case: case.name,
+)
+def test_override_failure_logs_warning(
+    make_provider: Callable[[str, str], str],
+    monkeypatch: pytest.MonkeyPatch,
+    case: OverrideWarningCase,
+):
+    """An override that cannot be applied leaves the model intact and warns."""
+    pdir = make_provider(case.src, 'p')
     mock_logger = MagicMock()
-    with pytest.MonkeyPatch.context() as mp:
-        mp.setattr(
-            'repolish.providers.context.logger',
-            mock_logger,
-        )
-        providers = create_providers([pdir], context_overrides={'y': 'value'})
-        ctx = next(iter(providers.provider_contexts.values()))
-        assert isinstance(ctx, BaseContext)
-        ctx_typed = cast('Any', ctx)
-        assert not hasattr(ctx_typed, 'y')
-        assert mock_logger.warning.call_count >= 1
-        # the override added a key that the model doesn't know about; the
-        # validation step will silently drop that key, so we expect a warning
-        # about ignored values rather than a validation error.
-        assert any('context_override_ignored' in str(call.args[0]) for call in mock_logger.warning.call_args_list)
+    monkeypatch.setattr('repolish.providers.context.logger', mock_logger)
+
+    providers = create_providers([pdir], context_overrides=case.overrides)
+
+    ctx = next(iter(providers.provider_contexts.values()))
+    assert isinstance(ctx, BaseContext)
+    assert ctx.model_dump(exclude={'repolish'}) == case.expected
+    assert any(call.args[0] == case.warning for call in mock_logger.warning.call_args_list)
 
 
 def test_override_on_nested_default_model(
@@ -505,9 +493,7 @@ class P(Provider[Ctx, BaseInputs]):
     providers = create_providers([pdir], context_overrides={'inner.x': 42})
     ctx = next(iter(providers.provider_contexts.values()))
     assert isinstance(ctx, BaseContext)
-    ctx_typed = cast('Any', ctx)
-    assert hasattr(ctx_typed, 'inner')
-    assert ctx_typed.inner.x == 42
+    assert ctx.model_dump()['inner']['x'] == 42
 
 
 def test_finalize_provider_contexts_edge_cases() -> None:
@@ -519,22 +505,18 @@ def test_finalize_provider_contexts_edge_cases() -> None:
     instances).  The test exercises both paths.
     """
     # skip when instance None (no provider to call)
-    ctxs: dict[str, object] = {}
-    finalize_provider_contexts([('p', {})], [None], {}, cast('dict', ctxs), [])
+    ctxs: dict[str, BaseContext] = {}
+    finalize_provider_contexts([('p', {})], [None], {}, ctxs, [])
     assert ctxs == {}
 
     # provider with no inputs still has finalize_context executed
-    class Setter(DummyProvider):
-        def finalize_context(
-            self,
-            opt: FinalizeContextOptions[BaseContext, BaseInputs],
-        ) -> BaseContext:
-            return cast('BaseContext', {'called': True})
+    provider_contexts: dict[str, BaseContext] = {}
+    finalize_provider_contexts([('p', {})], [_FinalizeSetter()], {}, provider_contexts, [])
+    assert provider_contexts['p'] is _FINALIZED_CONTEXT
 
 
-def test_apply_annotated_tm_suppress_with_source_template() -> None:
+def test_apply_annotated_tm_suppress_with_source_template(accum: Accumulators) -> None:
     """SUPPRESS mode records the source template path in suppressed_sources."""
-    accum = Accumulators()
     tm = TemplateMapping(
         source_template='_repolish.template.yaml',
         file_mode=FileMode.SUPPRESS,
@@ -546,39 +528,40 @@ def test_apply_annotated_tm_suppress_with_source_template() -> None:
     assert 'out.yaml' not in accum.merged_file_mappings
 
 
-def test_collect_promoted_fm_with_template_mapping_object() -> None:
+def test_collect_promoted_fm_with_template_mapping_object(accum: Accumulators) -> None:
     """TemplateMapping values are folded preserving all fields."""
-    accum = Accumulators()
     src_tm = TemplateMapping(
         source_template='_repolish.tmpl.yaml',
         extra_context={'key': 'val'},
     )
     _collect_promoted_fm('p', {'README.md': src_tm}, accum)
-    result = cast('TemplateMapping', accum.promoted_file_mappings['README.md'])
+    result = accum.promoted_file_mappings['README.md']
+    assert isinstance(result, TemplateMapping)
     assert result.source_template == '_repolish.tmpl.yaml'
     assert result.extra_context == {'key': 'val'}
     assert result.source_provider == 'p'
 
 
-def test_collect_promoted_fm_str_and_none_branches() -> None:
+def test_collect_promoted_fm_str_and_none_branches(accum: Accumulators) -> None:
     """Str src populates TemplateMapping; None src is skipped."""
-    accum = Accumulators()
     _collect_promoted_fm('p', {'out.md': 'tmpl.md', 'skip.md': None}, accum)
     assert 'skip.md' not in accum.promoted_file_mappings
-    result = cast('TemplateMapping', accum.promoted_file_mappings['out.md'])
+    result = accum.promoted_file_mappings['out.md']
+    assert isinstance(result, TemplateMapping)
     assert result.source_template == 'tmpl.md'
     assert result.source_provider == 'p'
 
 
 def test_handle_promote_file_mappings_warns_in_standalone_mode(
-    mocker: 'MockerFixture',
+    monkeypatch: pytest.MonkeyPatch,
+    accum: Accumulators,
 ) -> None:
     """promote_file_mappings result is logged and ignored in standalone/root mode."""
     mock_inst = MagicMock(spec=DummyProvider)
     mock_inst.promote_file_mappings.return_value = {'README.md': 'tmpl.md'}
 
-    mock_warn = mocker.patch('repolish.providers.exchange.logger.warning')
-    accum = Accumulators()
+    mock_warn = MagicMock()
+    monkeypatch.setattr(logger, 'warning', mock_warn)
     own_ctx = BaseContext()  # workspace.mode defaults to 'standalone'
     _handle_promote_file_mappings(mock_inst, own_ctx, 'p', accum)
     mock_warn.assert_called_once()
@@ -587,16 +570,12 @@ def test_handle_promote_file_mappings_warns_in_standalone_mode(
     assert accum.promoted_file_mappings == {}
 
 
-def test_collect_provider_contribution_skips_non_base_context() -> None:
+def test_collect_provider_contribution_skips_non_base_context(accum: Accumulators) -> None:
     """When provider_contexts has a non-BaseContext value, the contribution is skipped."""
     inst = DummyProvider()
     module_dict = {'_repolish_provider_instance': inst}
     # supply a plain dict instead of BaseContext so the guard fires
-    provider_contexts: dict[str, BaseContext] = cast(
-        'dict[str, BaseContext]',
-        {'p': {}},
-    )
-    accum = Accumulators()
+    provider_contexts: dict[str, BaseContext] = {'p': {}}  # type: ignore[dict-item]
     _collect_provider_contribution('p', module_dict, provider_contexts, accum)
     # nothing should have been accumulated
     assert accum.merged_file_mappings == {}
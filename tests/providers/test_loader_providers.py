@@ -1,12 +1,11 @@
 import importlib
 import sys
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 from textwrap import dedent
-from typing import cast
 
 import pytest
-from pydantic import BaseModel
 from pytest_mock import MockerFixture
 
 from repolish import BaseContext
@@ -22,138 +21,208 @@ class ProviderCase:
     name: str
     providers: list[str]
     expected_anchors: dict
-    expected_delete: list[Path]
+    expected_delete: frozenset[Path]
+
+
+@dataclass
+class RaisingCase:
+    name: str
+    providers: list[str]
+
+
+# Provider sources for the case tables below, dedented once at import.
+
+# one class-based provider with context, anchors, and file_mappings-based deletes
+_SRC_SINGLE_PROVIDER = dedent(
+    """
+    from repolish import BaseContext, Provider, BaseInputs, TemplateMapping, FileMode
+
+    class Ctx(BaseContext):
+        a: int = 0
+
+    class MyProvider(Provider[Ctx, BaseInputs]):
+        def create_context(self):
+            return Ctx(a=1)
+
+        def create_anchors(self, context=None):
+            return {'X': 'replace'}
+
+        def create_file_mappings(self, context=None):
+            return {
+                'foo.txt': TemplateMapping(source_template=None, file_mode=FileMode.DELETE),
+                'sub/bar.txt': TemplateMapping(source_template=None, file_mode=FileMode.DELETE),
+            }
+    """,
+)
+
+# first provider: contributes a, keep, anchor X=first, and two delete entries
+_SRC_OVERRIDE_FIRST = dedent(
+    """
+    from repolish import BaseContext, Provider, BaseInputs, TemplateMapping, FileMode
+
+    class Ctx(BaseContext):
+        a: int = 0
+        keep: bool = False
+
+    class ProviderOne(Provider[Ctx, BaseInputs]):
+        def create_context(self):
+            return Ctx(a=1, keep=True)
+
+        def create_anchors(self, context=None):
+            return {'X': 'first'}
+
+        def create_file_mappings(self, context=None):
+            return {
+                'a.txt': TemplateMapping(source_template=None, file_mode=FileMode.DELETE),
+                'c.txt': TemplateMapping(source_template=None, file_mode=FileMode.DELETE),
+            }
+    """,
+)
+
+# second provider: overrides a and anchor, cancels a.txt deletion, adds b.txt
+_SRC_OVERRIDE_SECOND = dedent(
+    """
+    from repolish import BaseContext, Provider, BaseInputs, TemplateMapping, FileMode
+
+    class Ctx(BaseContext):
+        a: int = 0
+
+    class ProviderTwo(Provider[Ctx, BaseInputs]):
+        def create_context(self):
+            return Ctx(a=2)
+
+        def create_anchors(self, context=None):
+            return {'X': 'second'}
+
+        def create_file_mappings(self, context=None):
+            return {
+                'a.txt': TemplateMapping(source_template=None, file_mode=FileMode.KEEP),
+                'b.txt': TemplateMapping(source_template=None, file_mode=FileMode.DELETE),
+            }
+    """,
+)
+
+# provider expressing deletes entirely through create_file_mappings
+_SRC_DELETE_VIA_FILE_MAPPINGS = dedent(
+    """
+    from repolish import BaseContext, Provider, BaseInputs, TemplateMapping, FileMode
+
+    class Ctx(BaseContext):
+        pass
+
+    class MyProvider(Provider[Ctx, BaseInputs]):
+        def create_context(self):
+            return Ctx()
+
+        def create_file_mappings(self, context=None):
+            return {
+                'one.txt': TemplateMapping(source_template=None, file_mode=FileMode.DELETE),
+                'two.txt': TemplateMapping(source_template=None, file_mode=FileMode.DELETE),
+            }
+    """,
+)
+
+_SRC_DELETE_FILES_MIXED = dedent(
+    """
+    def create_delete_files():
+        from pathlib import Path
+
+        return [Path('one.txt'), 123, None]
+    """,
+)
+
+_SRC_DELETE_FILES_RAISES_FALLBACK = dedent(
+    """
+    def create_delete_files():
+        raise RuntimeError('nope')
+
+    delete_files = ['fallback.txt']
+    """,
+)
+
+_SRC_MODULE_LEVEL_NON_PATHS = dedent(
+    """
+    # delete_files contains booleans and numbers -> ignored
+    delete_files = [True, False, 123]
+    """,
+)
+
+_SRC_CONTEXT_WRONG_TYPE = dedent(
+    """
+    def create_context():
+        return ['not', 'a', 'dict']
+    """,
+)
+
+_SRC_ANCHORS_WRONG_TYPE = dedent(
+    """
+    def create_anchors():
+        return ('not', 'a', 'dict')
+    """,
+)
+
+_SRC_DELETE_FILES_NON_ITERABLE = dedent(
+    """
+    def create_delete_files():
+        return 123
+    """,
+)
+
+
+_CaseDirs = tuple[ProviderCase, list[str | tuple[str, str]]]
+
+
+@pytest.fixture
+def case_dirs(
+    request: pytest.FixtureRequest,
+    make_provider: Callable[[str, str], str],
+) -> _CaseDirs:
+    """Write the providers of an indirectly parametrized `ProviderCase`.
+
+    Returns the case together with its provider directories.
+    """
+    case: ProviderCase = request.param
+    return case, [make_provider(src, f'prov{i}') for i, src in enumerate(case.providers)]
 
 
 @pytest.mark.parametrize(
-    'case',
+    'case_dirs',
     [
         ProviderCase(
             name='single_provider',
-            providers=[
-                # one class-based provider with context, anchors, and file_mappings-based deletes
-                dedent(
-                    """
-                    from repolish import BaseContext, Provider, BaseInputs, TemplateMapping, FileMode
-
-                    class Ctx(BaseContext):
-                        a: int = 0
-
-                    class MyProvider(Provider[Ctx, BaseInputs]):
-                        def create_context(self):
-                            return Ctx(a=1)
-
-                        def create_anchors(self, context=None):
-                            return {'X': 'replace'}
-
-                        def create_file_mappings(self, context=None):
-                            return {
-                                'foo.txt': TemplateMapping(source_template=None, file_mode=FileMode.DELETE),
-                                'sub/bar.txt': TemplateMapping(source_template=None, file_mode=FileMode.DELETE),
-                            }
-                    """,
-                ),
-            ],
+            providers=[_SRC_SINGLE_PROVIDER],
             expected_anchors={'X': 'replace'},
-            expected_delete=[Path('foo.txt'), Path('sub/bar.txt')],
+            expected_delete=frozenset({Path('foo.txt'), Path('sub/bar.txt')}),
         ),
         ProviderCase(
             name='override_and_negation',
             providers=[
-                # first provider: contributes a, keep, anchor X=first, and two delete entries
-                dedent(
-                    """
-                    from repolish import BaseContext, Provider, BaseInputs, TemplateMapping, FileMode
-
-                    class Ctx(BaseContext):
-                        a: int = 0
-                        keep: bool = False
-
-                    class ProviderOne(Provider[Ctx, BaseInputs]):
-                        def create_context(self):
-                            return Ctx(a=1, keep=True)
-
-                        def create_anchors(self, context=None):
-                            return {'X': 'first'}
-
-                        def create_file_mappings(self, context=None):
-                            return {
-                                'a.txt': TemplateMapping(source_template=None, file_mode=FileMode.DELETE),
-                                'c.txt': TemplateMapping(source_template=None, file_mode=FileMode.DELETE),
-                            }
-                    """,
-                ),
-                # second provider: overrides a and anchor, cancels a.txt deletion, adds b.txt
-                dedent(
-                    """
-                    from repolish import BaseContext, Provider, BaseInputs, TemplateMapping, FileMode
-
-                    class Ctx(BaseContext):
-                        a: int = 0
-
-                    class ProviderTwo(Provider[Ctx, BaseInputs]):
-                        def create_context(self):
-                            return Ctx(a=2)
-
-                        def create_anchors(self, context=None):
-                            return {'X': 'second'}
-
-                        def create_file_mappings(self, context=None):
-                            return {
-                                'a.txt': TemplateMapping(source_template=None, file_mode=FileMode.KEEP),
-                                'b.txt': TemplateMapping(source_template=None, file_mode=FileMode.DELETE),
-                            }
-                    """,
-                ),
+                _SRC_OVERRIDE_FIRST,
+                _SRC_OVERRIDE_SECOND,
             ],
             expected_anchors={'X': 'second'},
-            expected_delete=[Path('c.txt'), Path('b.txt')],
+            expected_delete=frozenset({Path('c.txt'), Path('b.txt')}),
         ),
         ProviderCase(
             name='delete_via_file_mappings',
-            providers=[
-                # provider expressing deletes entirely through create_file_mappings
-                dedent(
-                    """
-                    from repolish import BaseContext, Provider, BaseInputs, TemplateMapping, FileMode
-
-                    class Ctx(BaseContext):
-                        pass
-
-                    class MyProvider(Provider[Ctx, BaseInputs]):
-                        def create_context(self):
-                            return Ctx()
-
-                        def create_file_mappings(self, context=None):
-                            return {
-                                'one.txt': TemplateMapping(source_template=None, file_mode=FileMode.DELETE),
-                                'two.txt': TemplateMapping(source_template=None, file_mode=FileMode.DELETE),
-                            }
-                    """,
-                ),
-            ],
+            providers=[_SRC_DELETE_VIA_FILE_MAPPINGS],
             expected_anchors={},
-            expected_delete=[Path('one.txt'), Path('two.txt')],
+            expected_delete=frozenset({Path('one.txt'), Path('two.txt')}),
         ),
     ],
+    indirect=True,
+    ids=lambda case: case.name,
 )
-def test_create_providers(tmp_path: Path, case: ProviderCase):
-    # Create provider directories with repolish.py files
-    dirs: list[str | tuple[str, str]] = []
-    for i, src in enumerate(case.providers):
-        d = tmp_path / f'prov{i}'
-        d.mkdir()
-        (d / 'repolish.py').write_text(src)
-        dirs.append(str(d))
+def test_create_providers(case_dirs: _CaseDirs):
+    case, dirs = case_dirs
 
     providers = create_providers(dirs)
 
     assert providers.anchors == case.expected_anchors
 
     # delete_files should be a list of Path objects (relative paths from provider)
-    got_delete = {Path(p) for p in providers.delete_files}
-    want_delete = set(case.expected_delete)
-    assert got_delete == want_delete
+    got_delete = set(providers.delete_files)
+    assert got_delete == case.expected_delete
     # Verify provenance: for every path mentioned in delete_history, the
     # last recorded Decision should reflect the final presence in providers.delete_files
     for key, decisions in providers.delete_history.items():
@@ -204,8 +273,7 @@ def test_multiple_provider_classes_with_all(tmp_path: Path):
     )
 
     providers = create_providers([str(prov)])  # should succeed using A
-    pid = next(iter(providers.provider_contexts.keys()))
-    ctx = providers.provider_contexts[pid]
+    (ctx,) = providers.provider_contexts.values()
     assert isinstance(ctx, BaseContext)
     serialized = ctx.model_dump()
     assert 'which' in serialized
@@ -276,6 +344,11 @@ class Checker(Provider[Ctx, BaseInputs]):
     assert providers.provider_contexts is not None
 
 
+def _fixed_owner_repo() -> tuple[str, str]:
+    """Stand-in for `_get_owner_repo` so the global context is predictable."""
+    return ('x', 'y')
+
+
 def test_global_context_in_class_based_provider(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -287,7 +360,7 @@ def test_global_context_in_class_based_provider(
     """
     monkeypatch.setattr(
         'repolish.providers.models.context._get_owner_repo',
-        lambda: ('x', 'y'),
+        _fixed_owner_repo,
     )
 
     prov = tmp_path / 'cp'
@@ -308,9 +381,7 @@ class P(Provider[Ctx, BaseModel]):
 
     providers = create_providers([str(prov)])
     # GlobalContext is injected into each provider's typed context.
-    pid = next(iter(providers.provider_contexts.keys()))
-
-    ctx = providers.provider_contexts[pid]
+    (ctx,) = providers.provider_contexts.values()
     assert ctx.repolish.repo.owner == 'x'
     assert ctx.repolish.repo.name == 'y'
 
@@ -350,126 +421,126 @@ class Two(Provider[Ctx, BaseModel]):
     assert '__all__' in msg  # hint should mention the export list
 
 
-def test_create_providers_records_provider_contexts(tmp_path: Path):
-    """Each loaded provider gets its own typed entry in provider_contexts."""
-    src_a = dedent(
-        """
-        from repolish import BaseContext, Provider, BaseInputs
+# Class-based provider sources, dedented once at import and written by
+# `make_provider`.
+_SRC_CTX_A = dedent(
+    """
+    from repolish import BaseContext, Provider, BaseInputs
 
-        class CtxA(BaseContext):
-            a: int = 0
+    class CtxA(BaseContext):
+        a: int = 0
 
-        class ProviderA(Provider[CtxA, BaseInputs]):
-            def create_context(self):
-                return CtxA(a=1)
+    class ProviderA(Provider[CtxA, BaseInputs]):
+        def create_context(self):
+            return CtxA(a=1)
 
-            def create_file_mappings(self, context=None):
-                return {'x.txt': 'tmpl'}
-        """,
-    )
-    src_b = dedent(
-        """
-        from repolish import BaseContext, Provider, BaseInputs
+        def create_file_mappings(self, context=None):
+            return {'x.txt': 'tmpl'}
+    """,
+)
 
-        class CtxB(BaseContext):
-            b: int = 0
+_SRC_CTX_B = dedent(
+    """
+    from repolish import BaseContext, Provider, BaseInputs
 
-        class ProviderB(Provider[CtxB, BaseInputs]):
-            def create_context(self):
-                return CtxB(b=42)
+    class CtxB(BaseContext):
+        b: int = 0
 
-            def create_file_mappings(self, context=None):
-                return {'y.txt': 'tmpl'}
-        """,
-    )
+    class ProviderB(Provider[CtxB, BaseInputs]):
+        def create_context(self):
+            return CtxB(b=42)
 
-    dirs: list[str | tuple[str, str]] = []
-    for i, src in enumerate((src_a, src_b)):
-        d = tmp_path / f'prov{i}'
-        d.mkdir()
-        (d / 'repolish.py').write_text(src)
-        dirs.append(str(d))
+        def create_file_mappings(self, context=None):
+            return {'y.txt': 'tmpl'}
+    """,
+)
 
-    providers = create_providers(dirs)
+# Provider A -> sends an input to provider B
+_SRC_INPUT_SENDER = dedent(
+    """
+    from repolish import Provider, BaseContext, BaseInputs
 
-    # each provider should have its own typed context entry
-    assert isinstance(providers.provider_contexts, dict)
-    assert len(providers.provider_contexts) == 2
-    pids = list(providers.provider_contexts.keys())
-    ctx0 = providers.provider_contexts[pids[0]].model_dump()
-    assert ctx0.get('a') == 1
-    ctx1 = providers.provider_contexts[pids[1]].model_dump()
-    assert ctx1.get('b') == 42
+    class AInputs(BaseInputs):
+        register_component: str
 
+    class AContext(BaseContext):
+        val: int = 1
 
-def test_provider_exchange_input_routing_and_finalize(tmp_path: Path):
-    """Phase 2/3: provider A sends inputs to provider B and B finalizes context."""
-    # Provider A -> sends an input to provider B
-    p_a = tmp_path / 'prov_a'
-    p_a.mkdir()
-    (p_a / 'repolish.py').write_text(
-        dedent(
-            """
-            from repolish import Provider, BaseContext, BaseInputs
+    class AProvider(Provider[AContext, BaseInputs]):
+        def create_context(self) -> AContext:
+            return AContext()
 
-            class AInputs(BaseInputs):
-                register_component: str
+        def provide_inputs(self, opt):
+            return [AInputs(register_component='database')]
+    """,
+)
 
-            class AContext(BaseContext):
-                val: int = 1
+_SRC_INPUT_RECEIVER = dedent(
+    """
+    from repolish import Provider, BaseContext, BaseInputs
 
-            class AProvider(Provider[AContext, BaseInputs]):
-                def create_context(self) -> AContext:
-                    return AContext()
+    class BContext(BaseContext):
+        registered_components: list[str] = []
 
-                def provide_inputs(self, opt):
-                    return [AInputs(register_component='database')]
-            """,
-        ),
-    )
+    class BInputs(BaseInputs):
+        register_component: str
 
-    p_b = tmp_path / 'prov_b'
-    p_b.mkdir()
-    (p_b / 'repolish.py').write_text(
-        dedent(
-            """
-            from repolish import Provider, BaseContext, BaseInputs
+    class BProvider(Provider[BContext, BInputs]):
+        def create_context(self) -> BContext:
+            return BContext()
 
-            class BContext(BaseContext):
-                registered_components: list[str] = []
+        def get_inputs_schema(self):
+            return BInputs
 
-            class BInputs(BaseInputs):
-                register_component: str
+        def finalize_context(self, opt):
+            opt.own_context.registered_components = (
+                opt.own_context.registered_components
+                + [i.register_component for i in opt.received_inputs]
+            )
+            return opt.own_context
+    """,
+)
 
-            class BProvider(Provider[BContext, BInputs]):
-                def create_context(self) -> BContext:
-                    return BContext()
+_SRC_NAMED_CTX = dedent(
+    """
+    from repolish import BaseContext, BaseInputs, Provider
 
-                def get_inputs_schema(self):
-                    return BInputs
+    class Ctx(BaseContext):
+        name: str = 'from-class'
 
-                def finalize_context(self, opt):
-                    opt.own_context.registered_components = (
-                        opt.own_context.registered_components
-                        + [i.register_component for i in opt.received_inputs]
-                    )
-                    return opt.own_context
-            """,
-        ),
+    class MyProvider(Provider[Ctx, BaseInputs]):
+        def create_context(self) -> Ctx:
+            return Ctx(name='created-by-class')
+    """,
+)
+
+
+def test_create_providers_records_provider_contexts(
+    make_provider: Callable[[str, str], str],
+):
+    """Each loaded provider gets its own typed entry in provider_contexts."""
+    providers = create_providers(
+        [make_provider(_SRC_CTX_A, 'prov0'), make_provider(_SRC_CTX_B, 'prov1')],
     )
 
-    providers = create_providers([str(p_a), str(p_b)])
-    pids = list(providers.provider_contexts.keys())
-    ctx1 = providers.provider_contexts[pids[1]]
-    if isinstance(ctx1, BaseModel):
-        ctx1 = ctx1.model_dump()
-    ctx1 = cast('dict[str, object]', ctx1)
-    assert ctx1.get(
-        'registered_components',
-    ) == ['database']
+    # each provider should have its own typed context entry
+    first, second = providers.provider_contexts.values()
+    assert first.model_dump().get('a') == 1
+    assert second.model_dump().get('b') == 42
+
 
+def test_provider_exchange_input_routing_and_finalize(
+    make_provider: Callable[[str, str], str],
+):
+    """Phase 2/3: provider A sends inputs to provider B and B finalizes context."""
+    providers = create_providers(
+        [make_provider(_SRC_INPUT_SENDER, 'prov_a'), make_provider(_SRC_INPUT_RECEIVER, 'prov_b')],
+    )
+    _, receiver = providers.provider_contexts.values()
+    assert receiver.model_dump().get('registered_components') == ['database']
 
-def test_provide_inputs_called_for_all_providers(tmp_path: Path):
+
+def test_provide_inputs_called_for_all_providers():
     """Every provider exposing a `provide_inputs` hook is invoked.
 
     Use a *module-style* provider so we can inspect its globals afterward and
@@ -587,160 +658,58 @@ class P(Provider[Ctx, BaseInputs]):
     assert mod.__file__ == str(src)
 
 
-# Additional edge cases expressed with the same ProviderCase dataclass
+# Loading is fail-fast, so every one of these edge cases makes
+# `create_providers` raise.
 @pytest.mark.parametrize(
     'case',
     [
-        ProviderCase(
+        RaisingCase(
             name='import_failure',
             providers=["raise RuntimeError('boom')\n"],
-            expected_anchors={},
-            expected_delete=[],
         ),
-        # In fail-fast mode the following provider definitions should raise
-        # during provider evaluation. Tests below assert exceptions.
-        ProviderCase(
+        RaisingCase(
             name='create_delete_files_mixed',
-            providers=[
-                dedent(
-                    """
-                    def create_delete_files():
-                        from pathlib import Path
-
-                        return [Path('one.txt'), 123, None]
-                    """,
-                ),
-            ],
-            expected_anchors={},
-            expected_delete=[Path('one.txt')],
+            providers=[_SRC_DELETE_FILES_MIXED],
         ),
-        ProviderCase(
+        RaisingCase(
             name='create_delete_files_raises_fallback',
-            providers=[
-                dedent(
-                    """
-                    def create_delete_files():
-                        raise RuntimeError('nope')
-
-                    delete_files = ['fallback.txt']
-                    """,
-                ),
-            ],
-            expected_anchors={},
-            expected_delete=[Path('fallback.txt')],
+            providers=[_SRC_DELETE_FILES_RAISES_FALLBACK],
         ),
-        ProviderCase(
+        RaisingCase(
             name='module_level_non_paths',
-            providers=[
-                dedent(
-                    """
-                    # delete_files contains booleans and numbers -> ignored
-                    delete_files = [True, False, 123]
-                    """,
-                ),
-            ],
-            expected_anchors={},
-            expected_delete=[],
+            providers=[_SRC_MODULE_LEVEL_NON_PATHS],
         ),
-        ProviderCase(
+        RaisingCase(
             name='create_context_wrong_type',
-            providers=[
-                dedent(
-                    """
-                    def create_context():
-                        return ['not', 'a', 'dict']
-                    """,
-                ),
-            ],
-            expected_anchors={},
-            expected_delete=[],
+            providers=[_SRC_CONTEXT_WRONG_TYPE],
         ),
-        ProviderCase(
+        RaisingCase(
             name='create_anchors_wrong_type',
-            providers=[
-                dedent(
-                    """
-                    def create_anchors():
-                        return ('not', 'a', 'dict')
-                    """,
-                ),
-            ],
-            expected_anchors={},
-            expected_delete=[],
+            providers=[_SRC_ANCHORS_WRONG_TYPE],
         ),
-        ProviderCase(
+        RaisingCase(
             name='create_delete_files_non_iterable',
-            providers=[
-                dedent(
-                    """
-                    def create_delete_files():
-                        return 123
-                    """,
-                ),
-            ],
-            expected_anchors={},
-            expected_delete=[],
+            providers=[_SRC_DELETE_FILES_NON_ITERABLE],
         ),
     ],
+    ids=lambda case: case.name,
 )
-def test_create_providers_edge_cases(tmp_path: Path, case: ProviderCase):
-    # Reuse the same test runner but with ProviderCase instances
-    dirs: list[str | tuple[str, str]] = []
-    for i, src in enumerate(case.providers):
-        d = tmp_path / f'prov{i}'
-        d.mkdir()
-        (d / 'repolish.py').write_text(src)
-        dirs.append(str(d))
-
-    # Some cases now raise due to fail-fast semantics. Map names to expected
-    # exception behavior.
-    raises = {
-        'import_failure',
-        'create_context_raises',
-        'create_anchors_raises',
-        'create_delete_files_mixed',
-        'create_delete_files_raises_fallback',
-        'module_level_non_paths',
-        'create_context_wrong_type',
-        'create_anchors_wrong_type',
-        'create_delete_files_non_iterable',
-    }
-
-    if case.name in raises:
-        with pytest.raises(Exception):  # noqa: B017, PT011 - broad exception to verify fail-fast
-            _ = create_providers(dirs)
-        return
-
-    providers = create_providers(dirs)
+def test_create_providers_edge_cases_raise(
+    case: RaisingCase,
+    make_provider: Callable[[str, str], str],
+):
+    dirs = [make_provider(src, f'prov{i}') for i, src in enumerate(case.providers)]
 
-    assert providers.anchors == case.expected_anchors
-    got_delete = {Path(p) for p in providers.delete_files}
-    assert got_delete == set(case.expected_delete)
+    with pytest.raises(Exception):  # noqa: B017, PT011 - broad exception to verify fail-fast
+        create_providers(dirs)
 
 
-def test_loader_instantiates_class_based_provider(tmp_path: Path):
+def test_loader_instantiates_class_based_provider(
+    make_provider: Callable[[str, str], str],
+):
     """Loader should detect and use a Provider subclass exported by module."""
-    provider_dir = tmp_path / 'provider'
-    provider_dir.mkdir()
-
-    (provider_dir / 'repolish.py').write_text(
-        dedent(
-            """
-            from repolish import BaseContext, BaseInputs, Provider
-
-            class Ctx(BaseContext):
-                name: str = 'from-class'
-
-            class MyProvider(Provider[Ctx, BaseInputs]):
-                def create_context(self) -> Ctx:
-                    return Ctx(name='created-by-class')
-            """,
-        ),
-    )
-
-    providers = create_providers([str(provider_dir)])
-    pid = next(iter(providers.provider_contexts.keys()))
-    ctx = providers.provider_contexts[pid]
+    providers = create_providers([make_provider(_SRC_NAMED_CTX, 'provider')])
+    (ctx,) = providers.provider_contexts.values()
     assert isinstance(ctx, BaseContext)
     serialized_ctx = ctx.model_dump()
     assert 'name' in serialized_ctx
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal, cast
+from typing import TYPE_CHECKING, Literal
 
 import pytest
 
@@ -39,10 +39,12 @@ if TYPE_CHECKING:
 # ---------------------------------------------------------------------------
 
 
-def _make_ctx(mode: str) -> BaseContext:
-    _mode = cast('Literal["root", "member", "standalone"]', mode)
-    workspace = WorkspaceContext(mode=_mode, root_dir=Path('/tmp'))  # noqa: S108 - test-only path value; no files are created here
-    session = ProviderSession(mode=_mode)
+_Mode = Literal['root', 'member', 'standalone']
+
+
+def _make_ctx(mode: _Mode) -> BaseContext:
+    workspace = WorkspaceContext(mode=mode, root_dir=Path('/tmp'))  # noqa: S108 - test-only path value; no files are created here
+    session = ProviderSession(mode=mode)
     provider_info = ProviderInfo(session=session)
     rc = RepolishContext(workspace=workspace, provider=provider_info)
     return BaseContext(repolish=rc)
@@ -143,7 +145,7 @@ class _HandledProvider(Provider[MyCtx, MyInputs]):
 @dataclass
 class ProvideInputsCase:
     name: str
-    mode: str
+    mode: _Mode
     expected_tag: str
 
 
@@ -208,7 +210,7 @@ def test_provide_inputs_no_handler_returns_empty() -> None:
 @dataclass
 class FinalizeCase:
     name: str
-    mode: str
+    mode: _Mode
     expected_value: str
 
 
@@ -270,7 +272,7 @@ def test_finalize_context_no_handler_returns_unchanged() -> None:
 @dataclass
 class FileMappingsCase:
     name: str
-    mode: str
+    mode: _Mode
     expected_key: str
 
 
@@ -314,7 +316,7 @@ def test_create_file_mappings_no_handler_returns_empty() -> None:
 @dataclass
 class AnchorsCase:
     name: str
-    mode: str
+    mode: _Mode
     expected_key: str
 
 
@@ -39,7 +39,7 @@ def test_provider_is_abstract_and_requires_methods(
 
     # logger.warning should have been called with the event name as first arg
     assert mock_warn.call_count == 1
-    assert 'provider_context_inference_failed' in str(mock_warn.call_args[0][0])
+    assert mock_warn.call_args.args[0] == 'provider_context_inference_failed'
 
 
 def test_minimal_provider_defaults_and_behavior():
@@ -165,9 +165,7 @@ def test_inference_failure_shows_hint(monkeypatch: pytest.MonkeyPatch):
     ctx = BadProvider().create_context()
     assert isinstance(ctx, BaseContext)
     assert mock_warn.call_count == 1
-    assert 'provider_context_instantiation_failed' in str(
-        mock_warn.call_args[0][0],
-    )
+    assert mock_warn.call_args.args[0] == 'provider_context_instantiation_failed'
 
 
 @pytest.mark.parametrize(
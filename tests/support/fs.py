@@ -9,8 +9,11 @@ copied in ``tests/loader/test_module.py`` but is now generic.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
 
 def _touch_init_file(path: Path) -> None:
     """Ensure ``__init__.py`` exists at ``path``.
@@ -74,3 +77,24 @@ def module_name_from_path(src: Path, sys_path_entry: Path) -> str:
     """
     relative = Path(str(src)).relative_to(sys_path_entry)
     return '.'.join(relative.with_suffix('').parts)
+
+
+def write_files(base: Path, files: dict[str, str] | dict[str, bytes]) -> None:
+    """Write several small files below ``base`` in one pass.
+
+    Keys are paths relative to ``base`` (``/``-separated) and values are the
+    file contents, either raw bytes or text that is encoded as UTF-8.  Each
+    distinct parent directory is created once and every file is written
+    with a raw ``os.open``/``os.write``/``os.close`` sequence, skipping the
+    text wrapper and codec lookup that ``Path.write_text`` sets up for every
+    call.
+    """
+    targets = [(base / rel, data if isinstance(data, bytes) else data.encode()) for rel, data in files.items()]
+    for parent in {path.parent for path, _ in targets}:
+        parent.mkdir(parents=True, exist_ok=True)
+    for path, data in targets:
+        fd = os.open(path, _WRITE_FLAGS, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)